@@ -1,10 +1,58 @@
 #!/bin/bash
 # build.sh
+#
+# Bundles the sidebar panel into a single minified, content-hashed file
+# with pre-compressed .gz/.br siblings, and records its name in
+# dist/manifest.json for the integration to pick up.
+set -euo pipefail
 
-# Create the dist directory if it doesn't exist
-mkdir -p custom_components/family_bell/frontend/dist
+WWW=custom_components/family_bell/www
+DIST="$WWW/dist"
+
+# Start clean so stale hashed bundles are not shipped
+rm -rf "$DIST"
+mkdir -p "$DIST"
 
 # Bundle the frontend assets using esbuild
-npx esbuild ./custom_components/family_bell/frontend/src/family_bell_panel.js --bundle --outfile=./custom_components/family_bell/frontend/dist/family_bell_panel.js --allow-overwrite
+npx --yes esbuild "$WWW/family_bell_panel.js" \
+  --bundle \
+  --minify \
+  --format=esm \
+  --target=es2020 \
+  --entry-names="[name]-[hash]" \
+  --outdir="$DIST" \
+  --metafile="$DIST/meta.json"
+
+# Pre-compress and write the manifest (node ships gzip and brotli)
+node - "$DIST" <<'EOF'
+const fs = require("fs");
+const path = require("path");
+const zlib = require("zlib");
+
+const dist = process.argv[2];
+const meta = JSON.parse(fs.readFileSync(path.join(dist, "meta.json")));
+const manifest = {};
+
+for (const [output, info] of Object.entries(meta.outputs)) {
+  if (!info.entryPoint) continue;
+  const file = path.basename(output);
+  const source = fs.readFileSync(output);
+  fs.writeFileSync(`${output}.gz`, zlib.gzipSync(source, { level: 9 }));
+  fs.writeFileSync(
+    `${output}.br`,
+    zlib.brotliCompressSync(source, {
+      params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 11 },
+    })
+  );
+  manifest[path.basename(info.entryPoint)] = file;
+  console.log(`${file}: ${source.length} bytes`);
+}
+
+fs.writeFileSync(
+  path.join(dist, "manifest.json"),
+  JSON.stringify(manifest, null, 2) + "\n"
+);
+fs.unlinkSync(path.join(dist, "meta.json"));
+EOF
 
-echo "Build complete."
\ No newline at end of file
+echo "Build complete."
@@ -1,13 +1,24 @@
+import asyncio
 import logging
-import datetime
 import voluptuous as vol
 import inspect
 import json
 import os
+import time
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.storage import Store
+from homeassistant.loader import async_get_integration
 from homeassistant.components import websocket_api
 
 try:
@@ -15,11 +26,27 @@ try:
 except ImportError:
     async_register_command = None
 
+try:
+    from homeassistant.components.websocket_api.messages import (
+        construct_result_message,
+    )
+    from homeassistant.helpers.json import json_bytes
+except ImportError:
+    construct_result_message = None
+    json_bytes = None
+
 try:
     from homeassistant.components.http import StaticPathConfig
 except ImportError:
     StaticPathConfig = None
 
+try:
+    from homeassistant.components.media_player import (
+        MediaPlayerEntityFeature,
+    )
+except ImportError:
+    MediaPlayerEntityFeature = None
+
 try:
     from homeassistant.components.frontend import (
         add_extra_js_url,
@@ -30,31 +57,56 @@ except ImportError:
     add_extra_js_url = None
     async_register_built_in_panel = None
     async_remove_panel = None
-from homeassistant.helpers.event import async_track_point_in_utc_time
-from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .announcement import AnnouncementPipeline
+from .const import (
+    DOMAIN,
+    MAX_LEAD_TIME,
+    SIGNAL_DATA_UPDATED,
+    SIGNAL_SCHEDULE_UPDATED,
+)
+from .delivery import DeliveryEngine
+from .models import WEEKDAYS, Bell
+from .scheduler import BellScheduler
+from .storage import BellStorage
+from .tts_cache import TTSCache
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = ["sensor"]
+SERVICE_UPCOMING = "upcoming"
+UPCOMING_SCHEMA = vol.Schema(
+    {
+        vol.Optional("limit", default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
 STORAGE_KEY = "family_bell_data"
 STORAGE_VERSION = 1
 PANEL_URL = "/family_bell/family_bell_panel.js"
+BUNDLE_URL = "/family_bell/dist"
 
-# Schema for a single bell
+# Schema for a single bell; times are H:MM or HH:MM, 24-hour
 BELL_SCHEMA = vol.Schema(
     {
-        "id": str,
-        "name": str,
-        "time": str,
-        "days": [str],
-        "message": str,
-        "enabled": bool,
-        "speakers": [str],
+        vol.Required("id"): str,
+        vol.Required("name"): str,
+        vol.Required("time"): vol.All(
+            str, vol.Match(r"^([01]?\d|2[0-3]):[0-5]\d$")
+        ),
+        vol.Required("days"): [vol.In(WEEKDAYS)],
+        vol.Required("message"): str,
+        vol.Required("enabled"): bool,
+        vol.Required("speakers"): [str],
         vol.Optional("tts_provider"): vol.Any(str, None),
         vol.Optional("tts_voice"): vol.Any(str, None),
         vol.Optional("tts_language"): vol.Any(str, None),
         vol.Optional("sound"): vol.Any(str, dict, None),
+        vol.Optional("lead_time"): vol.Any(
+            vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_LEAD_TIME)), None
+        ),
     }
 )
 
@@ -65,21 +117,29 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
-    """Set up Family Bell from a config entry (UI Setup)."""
-
-    def read_version():
-        try:
-            manifest_path = hass.config.path(
-                "custom_components/family_bell/manifest.json"
-            )
-            with open(manifest_path, "r") as f:
-                manifest = json.load(f)
-            return manifest.get("version", "unknown")
-        except Exception as e:
-            _LOGGER.warning("Could not read version from manifest: %s", e)
-            return "unknown"
+    """Set up Family Bell from a config entry (UI Setup).
+
+    Independent steps run concurrently: loading the data, looking up the
+    version and probing the frontend files first, then registering the
+    frontend, panel and platforms. Each phase is timed and logged.
+    """
+    timings = {}
+    setup_start = time.monotonic()
+    frontend_dir = hass.config.path("custom_components/family_bell/www")
 
-    version = await hass.async_add_executor_job(read_version)
+    # 1. Setup Storage, read version, check frontend files
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    data, version, (frontend_ok, bundle) = await asyncio.gather(
+        _timed(timings, "load_data", _async_load_data(store)),
+        _timed(timings, "version", _async_get_version(hass)),
+        _timed(
+            timings,
+            "probe_frontend",
+            hass.async_add_executor_job(_probe_frontend, frontend_dir),
+        ),
+    )
+    if not frontend_ok:
+        return False
 
     _LOGGER.debug(
         "Setting up Family Bell config entry: %s (Version: %s)",
@@ -87,8 +147,97 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         version,
     )
 
-    # 1. Setup Storage
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    tts_cache = TTSCache(hass)
+    delivery = DeliveryEngine(hass)
+    announcements = AnnouncementPipeline(hass, entry, tts_cache, delivery)
+
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN] = {
+        "store": store,
+        "data": data,
+        "storage": BellStorage(store, data),
+        "scheduler": BellScheduler(
+            hass,
+            announcements.async_play,
+            announcements.async_prepare,
+            warm_up_callback=lambda bells: warm_up_bells(hass, bells),
+            lead_time=lambda bell: resolve_lead_time(entry, bell),
+            update_callback=lambda: async_dispatcher_send(
+                hass, SIGNAL_SCHEDULE_UPDATED
+            ),
+        ),
+        "tts_cache": tts_cache,
+        "delivery": delivery,
+        "announcements": announcements,
+        "entry_id": entry.entry_id,
+        "version": version,
+    }
+
+    # 2. Register Websocket Commands and Services
+    _register_websocket_commands(hass)
+
+    async def handle_upcoming(call: ServiceCall):
+        return {"upcoming": upcoming_fires(hass, call.data["limit"])}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UPCOMING,
+        handle_upcoming,
+        schema=UPCOMING_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # 3. Start Scheduler
+    _LOGGER.debug("Starting scheduler")
+    await _timed(timings, "schedule", schedule_bells(hass, entry))
+
+    # 4. Register Static Paths, Sidebar Panel and Sensors
+    await asyncio.gather(
+        _timed(
+            timings,
+            "static_paths",
+            _async_register_static_paths(hass, frontend_dir, bundle),
+        ),
+        _timed(timings, "panel", _async_register_panel(hass, version, bundle)),
+        _timed(
+            timings,
+            "platforms",
+            hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        ),
+    )
+
+    # 5. Listen for options updates
+    entry.async_on_unload(entry.add_update_listener(update_listener))
+
+    _LOGGER.debug(
+        "Async setup entry complete in %.3fs (%s)",
+        time.monotonic() - setup_start,
+        ", ".join(f"{name}: {t:.3f}s" for name, t in timings.items()),
+    )
+    return True
+
+
+async def _timed(timings, name, awaitable):
+    """Await a setup step, recording how long it took."""
+    start = time.monotonic()
+    try:
+        return await awaitable
+    finally:
+        timings[name] = time.monotonic() - start
+
+
+async def _async_get_version(hass):
+    """Return the integration version from its (cached) manifest."""
+    try:
+        integration = await async_get_integration(hass, DOMAIN)
+    except Exception as e:
+        _LOGGER.warning("Could not read version from manifest: %s", e)
+        return "unknown"
+    return str(integration.version or "unknown")
+
+
+async def _async_load_data(store):
+    """Load the stored data, migrating older formats."""
     data = await store.async_load() or {
         "bells": [],
         "vacation": {"enabled": False, "ranges": []},
@@ -108,39 +257,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             )
         data["vacation"] = new_vacation
         await store.async_save(data)
+    return data
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN] = {
-        "store": store,
-        "data": data,
-        "listeners": [],
-        "entry_id": entry.entry_id,
-        "version": version,
-    }
 
-    # 2. Register Static Paths for Frontend
-    # Use 'www' convention
-    frontend_dir = hass.config.path("custom_components/family_bell/www")
+def _probe_frontend(frontend_dir):
+    """Check the frontend files and look up the built bundle.
+
+    Runs in the executor. Returns ``(ok, bundle)``, where ``bundle`` is
+    the file name of the hashed bundle written by build.sh, or None to
+    serve the unbundled modules.
+    """
+    if not _frontend_files_exist(frontend_dir):
+        return False, None
+    manifest = os.path.join(frontend_dir, "dist", "manifest.json")
+    try:
+        with open(manifest, encoding="utf-8") as file:
+            bundle = json.load(file)["family_bell_panel.js"]
+    except (OSError, ValueError, KeyError, TypeError):
+        _LOGGER.debug("No frontend bundle, serving unbundled modules")
+        return True, None
+    _LOGGER.debug("Frontend bundle: %s", bundle)
+    return True, bundle
 
+
+def _frontend_files_exist(frontend_dir):
+    """Check the frontend files are installed; runs in the executor."""
     # Check if directory exists
     if not os.path.isdir(frontend_dir):
         _LOGGER.error("Frontend directory not found at path: %s", frontend_dir)
         return False
-    else:
-        _LOGGER.debug("Frontend directory confirmed at: %s", frontend_dir)
+    _LOGGER.debug("Frontend directory confirmed at: %s", frontend_dir)
 
     # Verify the panel file exists
     panel_file = os.path.join(frontend_dir, "family_bell_panel.js")
     if not os.path.isfile(panel_file):
         _LOGGER.error("Panel file not found at path: %s", panel_file)
         return False
+    return True
+
 
+async def _async_register_static_paths(hass, frontend_dir, bundle=None):
+    """Serve the frontend files under /family_bell.
+
+    A built bundle is served from /family_bell/dist with long-lived
+    cache headers: its name changes with its content, so browsers never
+    need to revalidate it, and aiohttp sends the pre-compressed .br or
+    .gz sibling when the browser accepts it.
+    """
     _LOGGER.debug("Registering static path: /family_bell -> %s", frontend_dir)
 
     if hasattr(hass.http, "async_register_static_paths") and StaticPathConfig:
-        paths_to_register = [
-            StaticPathConfig("/family_bell", frontend_dir, False),
-        ]
+        paths_to_register = []
+        if bundle:
+            paths_to_register.append(
+                StaticPathConfig(
+                    BUNDLE_URL, os.path.join(frontend_dir, "dist"), True
+                )
+            )
+        paths_to_register.append(
+            StaticPathConfig("/family_bell", frontend_dir, False)
+        )
         try:
             await hass.http.async_register_static_paths(paths_to_register)
             _LOGGER.debug("Registered static paths (async)")
@@ -152,6 +328,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         # Fallback for legacy HA or if StaticPathConfig is missing
         _LOGGER.debug("Using legacy static path registration")
         try:
+            if bundle:
+                hass.http.register_static_path(
+                    BUNDLE_URL, os.path.join(frontend_dir, "dist"), True
+                )
             hass.http.register_static_path("/family_bell", frontend_dir, False)
         except AttributeError:
             _LOGGER.error(
@@ -160,7 +340,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         except Exception as e:
             _LOGGER.error("Error registering static paths (legacy): %s", e)
 
-    # 3. Register Sidebar Panel
+
+async def _async_register_panel(hass, version, bundle=None):
+    """Register the sidebar panel, replacing any left from a reload."""
     _LOGGER.debug("Registering sidebar panel")
     # Explicitly remove existing panel to avoid overwrite error, which
     # can happen during reloads even with update=True in some cases.
@@ -180,8 +362,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     try:
         if async_register_built_in_panel:
-            # Construct versioned URL for cache busting
-            panel_url = f"{PANEL_URL}?v={version}"
+            # Construct versioned URL for cache busting; the bundle name
+            # is already content-hashed, the version is kept for the log
+            if bundle:
+                panel_url = f"{BUNDLE_URL}/{bundle}?v={version}"
+            else:
+                panel_url = f"{PANEL_URL}?v={version}"
 
             # NOTE: We do NOT need to call add_extra_js_url here because the 'custom'
             # panel component handles loading the module_url automatically.
@@ -252,49 +438,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     except Exception as err:
         _LOGGER.error("Unexpected error registering panel: %s", err)
 
-    # 4. Register Websocket Commands
+
+def _register_websocket_commands(hass):
+    """Register the websocket commands used by the panel."""
     _LOGGER.debug("Registering websocket commands")
     try:
-        if async_register_command:
-            async_register_command(hass, ws_get_data)
-            async_register_command(hass, ws_update_bell)
-            async_register_command(hass, ws_test_bell)
-            async_register_command(hass, ws_delete_bell)
-            async_register_command(hass, ws_update_vacation)
-        else:
-            hass.components.websocket_api.async_register_command(
-                hass, ws_get_data
-            )
-            hass.components.websocket_api.async_register_command(
-                hass, ws_update_bell
-            )
-            hass.components.websocket_api.async_register_command(
-                hass, ws_test_bell
-            )
-            hass.components.websocket_api.async_register_command(
-                hass, ws_delete_bell
-            )
-            hass.components.websocket_api.async_register_command(
-                hass, ws_update_vacation
-            )
+        for command in (
+            ws_get_data,
+            ws_update_bell,
+            ws_test_bell,
+            ws_delete_bell,
+            ws_update_bells,
+            ws_delete_bells,
+            ws_update_vacation,
+            ws_subscribe,
+            ws_list_bells,
+            ws_upcoming,
+        ):
+            if async_register_command:
+                async_register_command(hass, command)
+            else:
+                hass.components.websocket_api.async_register_command(
+                    hass, command
+                )
     except Exception:
         _LOGGER.debug("Websocket commands already registered")
 
-    # 5. Start Scheduler
-    _LOGGER.debug("Starting scheduler")
-    await schedule_bells(hass, entry)
-
-    # 6. Listen for options updates
-    entry.async_on_unload(entry.add_update_listener(update_listener))
-
-    _LOGGER.debug("Async setup entry complete")
-    return True
-
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
-    for remove_listener in hass.data[DOMAIN]["listeners"]:
-        remove_listener()
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    hass.services.async_remove(DOMAIN, SERVICE_UPCOMING)
+    hass.data[DOMAIN]["scheduler"].async_stop()
+    await hass.data[DOMAIN]["storage"].async_flush()
 
     if async_remove_panel:
         res = async_remove_panel(hass, "family-bell")
@@ -311,169 +488,242 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
 async def update_listener(hass, entry):
     """Handle options update."""
+    announcements = hass.data[DOMAIN]["announcements"]
+    announcements.clear()
+    async_dispatcher_send(
+        hass,
+        SIGNAL_DATA_UPDATED,
+        {
+            "revision": hass.data[DOMAIN]["storage"].bump_revision(),
+            "global_tts": announcements.global_tts.as_dict(),
+        },
+    )
     await schedule_bells(hass, entry)
 
 
 async def save_data(hass):
-    """Save data to storage."""
-    store = hass.data[DOMAIN]["store"]
-    data = hass.data[DOMAIN]["data"]
-    await store.async_save(data)
+    """Queue a save of the data and notify listeners.
+
+    Writes are coalesced by BellStorage; rescheduling is left to the
+    caller, which knows what changed. Subscribers get the changes as a
+    delta. Returns the revision the data is now at, which commands
+    acknowledge with so clients can tell whether they missed a delta.
+    """
+    storage = hass.data[DOMAIN]["storage"]
+    storage.async_schedule_save()
+    delta = storage.pop_changes()
+    if delta:
+        async_dispatcher_send(hass, SIGNAL_DATA_UPDATED, delta)
     hass.bus.async_fire("family_bell_update")
-
-    entry_id = hass.data[DOMAIN]["entry_id"]
-    entry = hass.config_entries.async_get_entry(entry_id)
-    await schedule_bells(hass, entry)
+    return storage.revision
 
 
 # --- Scheduler Logic ---
 
 
 async def schedule_bells(hass, entry):
-    """Cancel old listeners and schedule next bells using Options for TTS."""
+    """Rebuild the scheduler queue from the stored bells."""
     _LOGGER.debug("Scheduling bells")
-    for remove_listener in hass.data[DOMAIN]["listeners"]:
-        remove_listener()
-    hass.data[DOMAIN]["listeners"] = []
+    storage = hass.data[DOMAIN]["storage"]
+    hass.data[DOMAIN]["scheduler"].async_load(
+        (bell for bell in storage.bells.values() if bell.enabled),
+        storage.vacation,
+    )
 
-    data = hass.data[DOMAIN]["data"]
 
-    # Retrieve TTS Settings
-    tts_provider = entry.options.get(
-        "tts_provider", entry.data.get("tts_provider")
-    )
-    tts_voice = entry.options.get("tts_voice", None)
-    tts_lang = entry.options.get("tts_language")
-
-    # Check Vacation Mode
-    if data.get("vacation", {}).get("enabled"):
-        now_date = dt_util.now().date()
-        is_vacation = False
-        for r in data["vacation"].get("ranges", []):
-            try:
-                start = datetime.datetime.strptime(
-                    r["start"], "%Y-%m-%d"
-                ).date()
-                end = datetime.datetime.strptime(r["end"], "%Y-%m-%d").date()
-                if start <= now_date <= end:
-                    is_vacation = True
-                    break
-            except (ValueError, TypeError):
-                continue
-
-        if is_vacation:
-            _LOGGER.debug("Vacation mode enabled and active")
-            return
-
-    now = dt_util.now()
-    for bell in data["bells"]:
-        if not bell["enabled"]:
-            continue
+def resolve_lead_time(entry, bell):
+    """Return how many seconds before a bell its speakers are warmed up."""
+    if bell.lead_time is not None:
+        return bell.lead_time
+    return int(entry.options.get("lead_time", 0))
 
-        b_hour, b_minute = map(int, bell["time"].split(":"))
-        next_run = now.replace(
-            hour=b_hour, minute=b_minute, second=0, microsecond=0
-        )
-        if next_run <= now:
-            next_run += datetime.timedelta(days=1)
-
-        def create_callback(bell_data):
-            async def fire_bell(now_time):
-                current_day = now_time.strftime("%a").lower()
-                if current_day in bell_data["days"]:
-                    # Use bell specific TTS if set, else global
-                    provider = bell_data.get("tts_provider") or tts_provider
-                    voice = bell_data.get("tts_voice") or tts_voice
-                    lang = bell_data.get("tts_language") or tts_lang
-
-                    sound = bell_data.get("sound")
-                    if sound:
-                        media_id = None
-                        media_type = "music"
-                        if isinstance(sound, dict):
-                            media_id = sound.get("media_content_id")
-                            media_type = sound.get(
-                                "media_content_type", "music"
-                            )
-                        elif isinstance(sound, str):
-                            media_id = sound
-
-                        if media_id:
-                            try:
-                                res = hass.services.async_call(
-                                    "media_player",
-                                    "play_media",
-                                    {
-                                        "entity_id": bell_data["speakers"],
-                                        "media_content_id": media_id,
-                                        "media_content_type": media_type,
-                                        "announce": True,
-                                    },
-                                )
-                                if inspect.isawaitable(res):
-                                    await res
-                            except Exception as e:
-                                _LOGGER.warning(
-                                    "Failed to play pre-announcement sound: %s",
-                                    e,
-                                )
-
-                    service_data = {
-                        "entity_id": provider,
-                        "message": bell_data["message"],
-                        "media_player_entity_id": bell_data["speakers"],
-                    }
-                    if lang:
-                        # Piper fails if language is set to 'en'
-                        if lang == "en":
-                            lang = None
-                        else:
-                            service_data["language"] = lang
-                    if voice:
-                        service_data["options"] = {"voice": voice}
-
-                    res = hass.services.async_call(
-                        "tts", "speak", service_data
-                    )
-                    if inspect.isawaitable(res):
-                        await res
 
-                await schedule_bells(hass, entry)
+async def warm_up_bells(hass, bells):
+    """Get speakers and announcements ready for bells about to fire.
 
-            return fire_bell
+    Announcements are rendered if they are not cached yet, and speakers
+    that are off or in standby are switched on so the first words are
+    not lost while they wake up.
+    """
+    await hass.data[DOMAIN]["announcements"].async_prepare(bells)
 
-        listener = async_track_point_in_utc_time(
-            hass, create_callback(bell), next_run
+    to_wake = set()
+    for entity_id in {s for bell in bells for s in bell.speakers}:
+        state = hass.states.get(entity_id)
+        if state is None or state.state == "unavailable":
+            _LOGGER.warning("Speaker %s is not available", entity_id)
+            continue
+        if state.state not in ("off", "standby"):
+            continue
+        features = state.attributes.get("supported_features", 0)
+        if MediaPlayerEntityFeature and (
+            features & MediaPlayerEntityFeature.TURN_ON
+        ):
+            to_wake.add(entity_id)
+
+    if not to_wake:
+        return
+    _LOGGER.debug("Warming up speakers %s", sorted(to_wake))
+    try:
+        res = hass.services.async_call(
+            "media_player", "turn_on", {"entity_id": sorted(to_wake)}
         )
-        hass.data[DOMAIN]["listeners"].append(listener)
+        if inspect.isawaitable(res):
+            await res
+    except Exception as e:
+        _LOGGER.warning("Failed to warm up speakers: %s", e)
 
 
 # --- WebSocket Handlers ---
 
 
 @websocket_api.websocket_command(
-    {vol.Required("type"): "family_bell/get_data"}
+    {
+        vol.Required("type"): "family_bell/get_data",
+        vol.Optional("revision"): int,
+    }
 )
 @websocket_api.async_response
 async def ws_get_data(hass, connection, msg):
-    data = hass.data[DOMAIN]["data"]
+    """Return the data, or just "unchanged" if the client is up to date."""
+    snapshot = get_snapshot(hass)
+    if msg.get("revision") == snapshot.revision:
+        connection.send_result(
+            msg["id"], {"unchanged": True, "revision": snapshot.revision}
+        )
+    elif construct_result_message is not None:
+        connection.send_message(
+            construct_result_message(msg["id"], snapshot.json)
+        )
+    else:
+        connection.send_result(msg["id"], snapshot.payload)
+
+
+class DataSnapshot:
+    """The data as served to the panel, for one data revision.
+
+    The payload is built once per revision and serialized at most once;
+    treat it as read-only.
+    """
+
+    def __init__(self, revision, payload):
+        self.revision = revision
+        self.payload = payload
+        self._json = None
+
+    @property
+    def json(self):
+        """Return the payload serialized for the websocket."""
+        if self._json is None:
+            self._json = json_bytes(self.payload)
+        return self._json
+
 
+def get_snapshot(hass):
+    """Return the snapshot of the current revision, building it if needed."""
+    domain_data = hass.data[DOMAIN]
+    storage = domain_data["storage"]
+    snapshot = domain_data.get("snapshot")
+    if snapshot is not None and snapshot.revision == storage.revision:
+        return snapshot
+
+    data = storage.as_dict()
     # Inject global TTS settings for frontend default
-    entry_id = hass.data[DOMAIN]["entry_id"]
-    entry = hass.config_entries.async_get_entry(entry_id)
-    if entry:
-        data["global_tts"] = {
-            "provider": entry.options.get(
-                "tts_provider", entry.data.get("tts_provider")
-            ),
-            "voice": entry.options.get("tts_voice"),
-            "language": entry.options.get("tts_language"),
+    data["global_tts"] = domain_data["announcements"].global_tts.as_dict()
+    # Inject version
+    data["version"] = domain_data.get("version", "unknown")
+    data["revision"] = storage.revision
+
+    snapshot = domain_data["snapshot"] = DataSnapshot(storage.revision, data)
+    return snapshot
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "family_bell/list_bells",
+        vol.Optional("text"): str,
+        vol.Optional("day"): vol.In(WEEKDAYS),
+        vol.Optional("speaker"): str,
+        vol.Optional("enabled"): bool,
+        vol.Optional("cursor"): vol.All(str, vol.Match(r"^\d+:\d+/")),
+        vol.Optional("limit", default=50): vol.All(
+            int, vol.Range(min=1, max=500)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_list_bells(hass, connection, msg):
+    """Return one page of bells matching the filters, sorted by time."""
+    storage = hass.data[DOMAIN]["storage"]
+    bell_ids, next_cursor = storage.index.query(
+        text=msg.get("text"),
+        day=msg.get("day"),
+        speaker=msg.get("speaker"),
+        enabled=msg.get("enabled"),
+        cursor=msg.get("cursor"),
+        limit=msg["limit"],
+    )
+    connection.send_result(
+        msg["id"],
+        {
+            "bells": [storage.bells[i].to_dict() for i in bell_ids],
+            "next_cursor": next_cursor,
+            "revision": storage.revision,
+        },
+    )
+
+
+def upcoming_fires(hass, limit):
+    """Return the next ``limit`` bell fires, earliest first."""
+    return [
+        {
+            "bell_id": bell.id,
+            "name": bell.name,
+            "message": bell.message,
+            "fire_time": fire_time.isoformat(),
         }
+        for fire_time, bell in hass.data[DOMAIN]["scheduler"].upcoming(limit)
+    ]
 
-    # Inject version
-    data["version"] = hass.data[DOMAIN].get("version", "unknown")
 
-    connection.send_result(msg["id"], data)
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "family_bell/upcoming",
+        **UPCOMING_SCHEMA.schema,
+    }
+)
+@websocket_api.async_response
+async def ws_upcoming(hass, connection, msg):
+    """Return the next scheduled fires across all bells."""
+    connection.send_result(
+        msg["id"], {"upcoming": upcoming_fires(hass, msg["limit"])}
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "family_bell/subscribe",
+    }
+)
+@callback
+def ws_subscribe(hass, connection, msg):
+    """Send a snapshot of the data, then every change as a delta."""
+
+    @callback
+    def forward_delta(delta):
+        connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_DATA_UPDATED, forward_delta
+    )
+    connection.send_result(msg["id"])
+    snapshot = get_snapshot(hass)
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {"revision": snapshot.revision, "snapshot": snapshot.payload},
+        )
+    )
 
 
 @websocket_api.websocket_command(
@@ -484,26 +734,85 @@ async def ws_get_data(hass, connection, msg):
 )
 @websocket_api.async_response
 async def ws_update_bell(hass, connection, msg):
-    bells = hass.data[DOMAIN]["data"]["bells"]
-    new_bell = msg["bell"]
+    new_bell = Bell.from_dict(msg["bell"])
+    upsert_bell(hass, new_bell)
+    hass.data[DOMAIN]["scheduler"].async_update_bell(new_bell)
+    revision = await save_data(hass)
+    connection.send_result(msg["id"], {"success": True, "revision": revision})
 
-    existing = next(
-        (i for i, b in enumerate(bells) if b["id"] == new_bell["id"]), None
-    )
-    if existing is not None:
-        bells[existing] = new_bell
-    else:
-        bells.append(new_bell)
+
+def upsert_bell(hass, new_bell):
+    """Add or replace a bell and remember its TTS defaults."""
+    storage = hass.data[DOMAIN]["storage"]
+    storage.upsert_bell(new_bell)
+    hass.data[DOMAIN]["tts_cache"].invalidate_bell(new_bell.id)
 
     # Update last defaults
-    hass.data[DOMAIN]["data"]["last_defaults"] = {
-        "provider": new_bell.get("tts_provider"),
-        "voice": new_bell.get("tts_voice"),
-        "language": new_bell.get("tts_language"),
+    storage.set_value(
+        "last_defaults",
+        {
+            "provider": new_bell.tts_provider,
+            "voice": new_bell.tts_voice,
+            "language": new_bell.tts_language,
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "family_bell/update_bells",
+        vol.Required("bells"): [dict],
     }
+)
+@websocket_api.async_response
+async def ws_update_bells(hass, connection, msg):
+    """Add or update several bells with a single save and reschedule.
+
+    Every bell is validated first; if any is invalid nothing is applied
+    and the valid ones are reported as ``not_applied``.
+    """
+    results = []
+    valid = []
+    for item in msg["bells"]:
+        try:
+            bell = Bell.from_dict(BELL_SCHEMA(item))
+        except (vol.Invalid, KeyError, TypeError, ValueError) as err:
+            message = str(err)
+            if isinstance(err, KeyError):
+                message = f"Missing field: {err}"
+            results.append(
+                {
+                    "id": item.get("id"),
+                    "success": False,
+                    "error": {"code": "invalid_format", "message": message},
+                }
+            )
+        else:
+            valid.append(bell)
+            results.append({"id": bell.id, "success": True})
+
+    if len(valid) != len(results):
+        # The valid bells were not saved either
+        not_applied = {
+            "code": "not_applied",
+            "message": "Another bell in the batch is invalid",
+        }
+        for result in results:
+            if result["success"]:
+                result.update(success=False, error=not_applied)
+        connection.send_result(
+            msg["id"], {"success": False, "results": results}
+        )
+        return
 
-    await save_data(hass)
-    connection.send_result(msg["id"], {"success": True})
+    for new_bell in valid:
+        upsert_bell(hass, new_bell)
+    hass.data[DOMAIN]["scheduler"].async_update_bells(valid)
+    revision = await save_data(hass)
+    connection.send_result(
+        msg["id"],
+        {"success": True, "revision": revision, "results": results},
+    )
 
 
 @websocket_api.websocket_command(
@@ -515,23 +824,10 @@ async def ws_update_bell(hass, connection, msg):
 @websocket_api.async_response
 async def ws_test_bell(hass, connection, msg):
     """Test a bell by playing it immediately."""
-    bell_data = msg["bell"]
-    entry_id = hass.data[DOMAIN]["entry_id"]
-    entry = hass.config_entries.async_get_entry(entry_id)
-
-    # Retrieve global TTS Settings
-    tts_provider = entry.options.get(
-        "tts_provider", entry.data.get("tts_provider")
-    )
-    tts_voice = entry.options.get("tts_voice", None)
-    tts_lang = entry.options.get("tts_language")
-
-    # Use bell specific TTS if set, else global
-    provider = bell_data.get("tts_provider") or tts_provider
-    voice = bell_data.get("tts_voice") or tts_voice
-    lang = bell_data.get("tts_language") or tts_lang
+    bell = Bell.from_dict(msg["bell"])
+    announcements = hass.data[DOMAIN]["announcements"]
 
-    if not provider:
+    if not announcements.resolve(bell, memoize=False).provider:
         connection.send_result(
             msg["id"],
             {
@@ -544,60 +840,22 @@ async def ws_test_bell(hass, connection, msg):
         )
         return
 
-    sound = bell_data.get("sound")
-    if sound:
-        media_id = None
-        media_type = "music"
-        if isinstance(sound, dict):
-            media_id = sound.get("media_content_id")
-            media_type = sound.get("media_content_type", "music")
-        elif isinstance(sound, str):
-            media_id = sound
-
-        if media_id:
-            try:
-                res = hass.services.async_call(
-                    "media_player",
-                    "play_media",
-                    {
-                        "entity_id": bell_data["speakers"],
-                        "media_content_id": media_id,
-                        "media_content_type": media_type,
-                        "announce": True,
-                    },
-                )
-                if inspect.isawaitable(res):
-                    await res
-            except Exception as e:
-                _LOGGER.warning("Failed to play pre-announcement sound: %s", e)
-
-    service_data = {
-        "entity_id": provider,
-        "message": bell_data["message"],
-        "media_player_entity_id": bell_data["speakers"],
-    }
-    if lang:
-        # Piper fails if language is set to 'en'
-        if lang == "en":
-            lang = None
-        else:
-            service_data["language"] = lang
-    if voice:
-        service_data["options"] = {"voice": voice}
-
-    try:
-        res = hass.services.async_call("tts", "speak", service_data)
-        if inspect.isawaitable(res):
-            await res
-        connection.send_result(msg["id"], {"success": True})
-    except Exception as e:
+    results = await announcements.async_test(bell)
+    failed = [r for r in results if not r["success"]]
+    if failed and len(failed) == len(results):
         connection.send_result(
             msg["id"],
             {
                 "success": False,
-                "error": {"code": "service_call_failed", "message": str(e)},
+                "error": {
+                    "code": "service_call_failed",
+                    "message": failed[0]["error"],
+                },
+                "results": results,
             },
         )
+        return
+    connection.send_result(msg["id"], {"success": True, "results": results})
 
 
 @websocket_api.websocket_command(
@@ -608,12 +866,49 @@ async def ws_test_bell(hass, connection, msg):
 )
 @websocket_api.async_response
 async def ws_delete_bell(hass, connection, msg):
-    bells = hass.data[DOMAIN]["data"]["bells"]
-    hass.data[DOMAIN]["data"]["bells"] = [
-        b for b in bells if b["id"] != msg["bell_id"]
-    ]
-    await save_data(hass)
-    connection.send_result(msg["id"], {"success": True})
+    remove_bell(hass, msg["bell_id"])
+    hass.data[DOMAIN]["scheduler"].async_remove_bell(msg["bell_id"])
+    revision = await save_data(hass)
+    connection.send_result(msg["id"], {"success": True, "revision": revision})
+
+
+def remove_bell(hass, bell_id):
+    """Delete a bell; return False if it did not exist."""
+    hass.data[DOMAIN]["tts_cache"].invalidate_bell(bell_id)
+    hass.data[DOMAIN]["delivery"].forget(bell_id)
+    hass.data[DOMAIN]["announcements"].invalidate(bell_id)
+    return hass.data[DOMAIN]["storage"].remove_bell(bell_id)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "family_bell/delete_bells",
+        vol.Required("bell_ids"): [str],
+    }
+)
+@websocket_api.async_response
+async def ws_delete_bells(hass, connection, msg):
+    """Delete several bells with a single save and reschedule."""
+    deleted = {
+        bell_id for bell_id in msg["bell_ids"] if remove_bell(hass, bell_id)
+    }
+    hass.data[DOMAIN]["scheduler"].async_remove_bells(deleted)
+    revision = await save_data(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "success": True,
+            "revision": revision,
+            "results": [
+                {
+                    "id": bell_id,
+                    "success": True,
+                    "deleted": bell_id in deleted,
+                }
+                for bell_id in msg["bell_ids"]
+            ],
+        },
+    )
 
 
 @websocket_api.websocket_command(
@@ -624,6 +919,8 @@ async def ws_delete_bell(hass, connection, msg):
 )
 @websocket_api.async_response
 async def ws_update_vacation(hass, connection, msg):
-    hass.data[DOMAIN]["data"]["vacation"] = msg["vacation"]
-    await save_data(hass)
-    connection.send_result(msg["id"], {"success": True})
+    storage = hass.data[DOMAIN]["storage"]
+    storage.set_vacation(msg["vacation"])
+    hass.data[DOMAIN]["scheduler"].async_set_vacation(storage.vacation)
+    revision = await save_data(hass)
+    connection.send_result(msg["id"], {"success": True, "revision": revision})
@@ -0,0 +1,226 @@
+"""Announcement pipeline shared by scheduled and test bells."""
+
+from dataclasses import dataclass
+import functools
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .delivery import DeliveryEngine, DeliveryStep
+from .tts_cache import CACHE_SIZE, TTSCache, tts_cache_key
+
+
+@dataclass(frozen=True, slots=True)
+class GlobalTTS:
+    """Integration-wide TTS settings, as configured in the options."""
+
+    provider: str | None = None
+    voice: str | None = None
+    language: str | None = None
+
+    @classmethod
+    def from_entry(cls, entry):
+        """Read the settings from Options, falling back to setup data."""
+        return cls(
+            provider=entry.options.get(
+                "tts_provider", entry.data.get("tts_provider")
+            ),
+            voice=entry.options.get("tts_voice"),
+            language=entry.options.get("tts_language"),
+        )
+
+    def as_dict(self):
+        """Return the settings in the shape the panel expects."""
+        return {
+            "provider": self.provider,
+            "voice": self.voice,
+            "language": self.language,
+        }
+
+    def resolve(self, bell):
+        """Return the (provider, voice, language) a bell is spoken with."""
+        # Use bell specific TTS if set, else global
+        provider = bell.tts_provider or self.provider
+        voice = bell.tts_voice or self.voice
+        lang = bell.tts_language or self.language
+        # Piper fails if language is set to 'en'
+        if lang == "en":
+            lang = None
+        return provider, voice or None, lang or None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _play_step(media_id):
+    """Return the step playing a pre-rendered announcement."""
+    return DeliveryStep(
+        "media_player",
+        "play_media",
+        {
+            "media_content_id": media_id,
+            "media_content_type": "music",
+            "announce": True,
+        },
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Announcement:
+    """A bell's resolved TTS settings and prebuilt service payloads."""
+
+    provider: str | None
+    voice: str | None
+    language: str | None
+    cache_key: tuple
+    # Pre-announcement sound, if the bell has one
+    chime: DeliveryStep | None
+    # tts.speak fallback; None without a provider
+    speak: DeliveryStep | None
+
+    @classmethod
+    def build(cls, global_tts, bell):
+        """Resolve a bell's settings and build its service payloads."""
+        provider, voice, lang = global_tts.resolve(bell)
+        chime = None
+        if bell.media_content_id:
+            chime = DeliveryStep(
+                "media_player",
+                "play_media",
+                {
+                    "media_content_id": bell.media_content_id,
+                    "media_content_type": bell.media_content_type,
+                    "announce": True,
+                },
+                optional=True,
+            )
+        speak = None
+        if provider:
+            service_data = {"entity_id": provider, "message": bell.message}
+            if lang:
+                service_data["language"] = lang
+            if voice:
+                service_data["options"] = {"voice": voice}
+            speak = DeliveryStep(
+                "tts",
+                "speak",
+                service_data,
+                target="media_player_entity_id",
+            )
+        return cls(
+            provider=provider,
+            voice=voice,
+            language=lang,
+            cache_key=tts_cache_key(bell.message, provider, voice, lang),
+            chime=chime,
+            speak=speak,
+        )
+
+    def steps(self, media_id):
+        """Return the delivery steps, playing ``media_id`` if rendered."""
+        steps = [self.chime] if self.chime else []
+        if media_id:
+            steps.append(_play_step(media_id))
+        elif self.speak:
+            steps.append(self.speak)
+        return steps
+
+
+class AnnouncementPipeline:
+    """Turn bells into deliveries, for both scheduled and test bells.
+
+    The global TTS settings are read from the config entry once, and
+    each bell's effective settings and service payloads are built once
+    per version of the bell; both are reused until the bell is edited or
+    the options change. At play time only the pre-rendered audio lookup
+    is left to do.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        tts_cache: TTSCache,
+        delivery: DeliveryEngine,
+    ):
+        self._hass = hass
+        self._entry = entry
+        self._tts_cache = tts_cache
+        self._delivery = delivery
+        self._global_tts = None
+        # bell_id -> (bell, Announcement) it was built from
+        self._announcements = {}
+        self.built = 0
+        self.reused = 0
+
+    @property
+    def global_tts(self):
+        """Return the global TTS settings, reading them if needed."""
+        if self._global_tts is None:
+            self._global_tts = GlobalTTS.from_entry(self._entry)
+        return self._global_tts
+
+    def resolve(self, bell, memoize=True):
+        """Return the announcement for a bell, building it if needed."""
+        cached = self._announcements.get(bell.id)
+        if cached is not None and cached[0] == bell:
+            self.reused += 1
+            return cached[1]
+        announcement = Announcement.build(self.global_tts, bell)
+        self.built += 1
+        if memoize:
+            self._announcements[bell.id] = (bell, announcement)
+        return announcement
+
+    def steps(self, bell, memoize=True):
+        """Return the delivery steps for a bell."""
+        announcement = self.resolve(bell, memoize)
+        return announcement.steps(self._tts_cache.get(announcement.cache_key))
+
+    async def async_prepare(self, bells):
+        """Pre-render the announcements of bells that are due next."""
+        for bell in bells:
+            announcement = self.resolve(bell)
+            if announcement.provider:
+                await self._tts_cache.async_prepare(
+                    bell.id, announcement.cache_key
+                )
+
+    async def async_play(self, bells):
+        """Play bells due in the same tick; return results by bell id."""
+        return await self._delivery.async_deliver_many(
+            [(bell.id, bell.speakers, self.steps(bell)) for bell in bells]
+        )
+
+    async def async_test(self, bell):
+        """Play an unsaved bell right away; return per-speaker results.
+
+        Test bells usually carry a throwaway id, so their results are not
+        kept.
+        """
+        return await self._delivery.async_deliver(
+            bell.id,
+            bell.speakers,
+            self.steps(bell, memoize=False),
+            record=False,
+        )
+
+    @callback
+    def invalidate(self, bell_id):
+        """Forget the announcement of an edited or deleted bell."""
+        self._announcements.pop(bell_id, None)
+
+    @callback
+    def clear(self):
+        """Forget the global settings and all announcements.
+
+        Called when the options change.
+        """
+        self._global_tts = None
+        self._announcements.clear()
+
+    def stats(self):
+        """Return reuse counters."""
+        return {
+            "announcements": len(self._announcements),
+            "built": self.built,
+            "reused": self.reused,
+        }
@@ -5,10 +5,13 @@ from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     EntitySelector,
     EntitySelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     TextSelector,
 )
 
-from .const import DOMAIN
+from .const import DOMAIN, MAX_LEAD_TIME
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,6 +76,7 @@ class FamilyBellOptionsFlowHandler(config_entries.OptionsFlow):
         )
         current_voice = self.config_entry.options.get("tts_voice", "")
         current_lang = self.config_entry.options.get("tts_language", "")
+        current_lead = self.config_entry.options.get("lead_time", 0)
 
         options_schema = vol.Schema(
             {
@@ -85,6 +89,17 @@ class FamilyBellOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(
                     "tts_language", default=current_lang
                 ): TextSelector(),
+                vol.Optional(
+                    "lead_time", description={"suggested_value": current_lead}
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=MAX_LEAD_TIME,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=NumberSelectorMode.BOX,
+                    )
+                ),
             }
         )
 
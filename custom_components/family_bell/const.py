@@ -1 +1,6 @@
 DOMAIN = "family_bell"
+SIGNAL_DATA_UPDATED = f"{DOMAIN}_data_updated"
+SIGNAL_SCHEDULE_UPDATED = f"{DOMAIN}_schedule_updated"
+
+# Longest warm-up before a bell, in seconds, globally or per bell
+MAX_LEAD_TIME = 300
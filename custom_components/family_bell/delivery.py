@@ -0,0 +1,254 @@
+"""Concurrent delivery of announcements to speakers."""
+
+import asyncio
+from dataclasses import dataclass
+import inspect
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a single speaker may take to accept a whole announcement
+SPEAKER_TIMEOUT = 15
+# Seconds an announcement may keep a speaker busy before the next one
+# is played anyway
+PLAYBACK_TIMEOUT = 60
+# Seconds a speaker may take to report that it started playing
+PLAYBACK_START_GRACE = 2
+# Media player states that mean an announcement is still being played
+PLAYING_STATES = {"playing", "buffering"}
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryStep:
+    """One service call of an announcement, made once per speaker.
+
+    ``target`` is the service data key the speaker is passed in. A failed
+    ``optional`` step is logged and the following steps still run.
+    """
+
+    domain: str
+    service: str
+    data: dict
+    target: str = "entity_id"
+    optional: bool = False
+
+
+def _playing_media(state):
+    """Return ``(media_content_id,)`` if a speaker is playing, else None."""
+    if state is None or state.state not in PLAYING_STATES:
+        return None
+    return (state.attributes.get("media_content_id"),)
+
+
+class DeliveryEngine:
+    """Play announcements on every speaker concurrently.
+
+    Each speaker gets its own chain of service calls, awaited under its
+    own timeout, so a slow or offline media player only loses its own
+    announcement. The outcome per speaker is recorded by delivery key
+    (the bell id) for diagnostics.
+
+    A speaker plays one announcement at a time: bells due together are
+    queued per speaker and played back to back, and identical
+    announcements are played once. The service calls return as soon as
+    the player accepts the media, so before giving a speaker the next
+    announcement the engine waits for it to stop playing the last one,
+    up to ``playback_timeout``. A speaker that was already playing other
+    media (announcements over music) is only waited for while it plays
+    something new. A per-speaker lock extends this to later deliveries.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        timeout=SPEAKER_TIMEOUT,
+        playback_timeout=PLAYBACK_TIMEOUT,
+    ):
+        self._hass = hass
+        self._timeout = timeout
+        self._playback_timeout = playback_timeout
+        self._locks = {}
+        # speaker -> when its last announcement was accepted, and what
+        # the speaker was playing before it
+        self._started = {}
+        self.results = {}
+        self.delivered = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.merged = 0
+
+    async def async_deliver(self, key, speakers, steps, record=True):
+        """Run ``steps`` on all ``speakers``; return per-speaker results."""
+        results = await self.async_deliver_many(
+            [(key, speakers, steps)], record
+        )
+        return results[key]
+
+    async def async_deliver_many(self, announcements, record=True):
+        """Run announcements that are due together.
+
+        ``announcements`` is an ordered list of ``(key, speakers, steps)``.
+        Returns the per-speaker results by key, and keeps them for
+        diagnostics unless ``record`` is False.
+        """
+        # speaker -> [(keys, steps)], in announcement order
+        queues = {}
+        for key, speakers, steps in announcements:
+            for speaker in speakers:
+                queue = queues.setdefault(speaker, [])
+                for keys, queued in queue:
+                    if queued == steps:
+                        keys.append(key)
+                        self.merged += 1
+                        break
+                else:
+                    queue.append(([key], steps))
+
+        results = {key: [] for key, _, _ in announcements}
+        outcomes = await asyncio.gather(
+            *(
+                self._async_run_queue(speaker, queue)
+                for speaker, queue in queues.items()
+            )
+        )
+        for queue_outcomes in outcomes:
+            for keys, result in queue_outcomes:
+                for key in keys:
+                    results[key].append(result)
+        if record:
+            self.results.update(results)
+        return results
+
+    async def _async_run_queue(self, speaker, queue):
+        """Play a speaker's queued announcements one after another."""
+        lock = self._locks.setdefault(speaker, asyncio.Lock())
+        outcomes = []
+        async with lock:
+            for keys, steps in queue:
+                await self._async_wait_for_playback(speaker)
+                started = (
+                    time.monotonic(),
+                    dt_util.utcnow(),
+                    _playing_media(self._hass.states.get(speaker)),
+                )
+                result = await self._async_deliver_to(speaker, steps)
+                if result["success"]:
+                    self._started[speaker] = started
+                outcomes.append((keys, result))
+        return outcomes
+
+    async def _async_wait_for_playback(self, speaker):
+        """Wait for a speaker to finish our last announcement on it.
+
+        The speaker is done once it is no longer playing, provided its
+        state changed since the announcement was sent or the start grace
+        period is over. If it was already playing before, it is only
+        busy while it plays other media than it did then. Gives up once
+        the playback timeout has passed since the announcement was sent.
+        """
+        if speaker not in self._started:
+            return
+        started, started_at, before = self._started.pop(speaker)
+        deadline = started + self._playback_timeout
+        grace_end = started + min(PLAYBACK_START_GRACE, self._playback_timeout)
+
+        changed = asyncio.Event()
+
+        @callback
+        def _state_changed(_event):
+            changed.set()
+
+        unsub = async_track_state_change_event(
+            self._hass, [speaker], _state_changed
+        )
+        try:
+            while (now := time.monotonic()) < deadline:
+                state = self._hass.states.get(speaker)
+                if state is None:
+                    return
+                if state.state in PLAYING_STATES:
+                    if before is not None and _playing_media(state) == before:
+                        return
+                    wait_until = deadline
+                elif now < grace_end and state.last_changed < started_at:
+                    wait_until = grace_end
+                else:
+                    return
+                changed.clear()
+                try:
+                    async with asyncio.timeout(wait_until - now):
+                        await changed.wait()
+                except TimeoutError:
+                    pass
+            _LOGGER.debug("%s still playing, playing next anyway", speaker)
+        finally:
+            unsub()
+
+    async def _async_deliver_to(self, speaker, steps):
+        """Run the steps for one speaker, never raising."""
+        start = time.monotonic()
+        error = None
+        try:
+            async with asyncio.timeout(self._timeout):
+                for step in steps:
+                    try:
+                        await self._async_call(speaker, step)
+                    except Exception as e:
+                        if not step.optional:
+                            raise
+                        _LOGGER.warning(
+                            "Failed to call %s.%s on %s: %s",
+                            step.domain,
+                            step.service,
+                            speaker,
+                            e,
+                        )
+        except TimeoutError:
+            self.timed_out += 1
+            error = "timeout"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+
+        elapsed = round(time.monotonic() - start, 3)
+        if error is None:
+            self.delivered += 1
+        else:
+            self.failed += 1
+            _LOGGER.error("Failed to play bell on %s: %s", speaker, error)
+        return {
+            "entity_id": speaker,
+            "success": error is None,
+            "error": error,
+            "elapsed": elapsed,
+        }
+
+    async def _async_call(self, speaker, step):
+        """Make one step's service call for one speaker."""
+        res = self._hass.services.async_call(
+            step.domain,
+            step.service,
+            {**step.data, step.target: [speaker]},
+            blocking=True,
+        )
+        if inspect.isawaitable(res):
+            await res
+
+    @callback
+    def forget(self, key):
+        """Drop the recorded results of a deleted bell."""
+        self.results.pop(key, None)
+
+    def stats(self):
+        """Return delivery counters and the latest results per bell."""
+        return {
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "merged": self.merged,
+            "last_results": self.results,
+        }
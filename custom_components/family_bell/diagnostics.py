@@ -0,0 +1,23 @@
+"""Diagnostics support for Family Bell."""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+):
+    """Return diagnostics for a config entry."""
+    domain_data = hass.data[DOMAIN]
+    storage = domain_data["storage"]
+    return {
+        "version": domain_data.get("version", "unknown"),
+        "bells": len(storage.bells),
+        "scheduled_bells": domain_data["scheduler"].scheduled_count,
+        "storage": storage.stats(),
+        "tts_cache": domain_data["tts_cache"].stats(),
+        "delivery": domain_data["delivery"].stats(),
+        "announcements": domain_data["announcements"].stats(),
+    }
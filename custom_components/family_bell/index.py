@@ -0,0 +1,124 @@
+"""Secondary indexes over the bells for listing and filtering."""
+
+import bisect
+
+
+def _sort_key(bell):
+    """Return the key bells are listed by: time of day, then id."""
+    return (bell.hour, bell.minute, bell.id)
+
+
+def encode_cursor(key):
+    """Return the opaque pagination cursor for a sort key."""
+    # Times never contain "/", so the first one separates the parts
+    return f"{key[0]:02d}:{key[1]:02d}/{key[2]}"
+
+
+def decode_cursor(cursor):
+    """Return the sort key a cursor was made from."""
+    time, _, bell_id = cursor.partition("/")
+    hour, minute = map(int, time.split(":"))
+    return (hour, minute, bell_id)
+
+
+class BellIndex:
+    """Bells sorted by time, plus lookups by day, speaker and state.
+
+    Kept up to date by ``BellStorage`` on every upsert and delete, so a
+    listing only touches the bells that can match: the smallest of the
+    day, speaker and enabled or disabled sets is intersected with the
+    others, and
+    text is matched last against a pre-lowered search string.
+    """
+
+    def __init__(self, bells=()):
+        self._keys = []
+        self._bells = {}
+        self._by_day = {}
+        self._by_speaker = {}
+        self._enabled = set()
+        self._disabled = set()
+        self._text = {}
+        for bell in bells:
+            self.add(bell)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, bell):
+        """Index a new or edited bell."""
+        self.remove(bell.id)
+        bisect.insort(self._keys, _sort_key(bell))
+        self._bells[bell.id] = bell
+        for day in bell.days:
+            self._by_day.setdefault(day, set()).add(bell.id)
+        for speaker in bell.speakers:
+            self._by_speaker.setdefault(speaker, set()).add(bell.id)
+        (self._enabled if bell.enabled else self._disabled).add(bell.id)
+        self._text[bell.id] = "\n".join(
+            (bell.name, bell.message, bell.time)
+        ).lower()
+
+    def remove(self, bell_id):
+        """Drop a bell from every index."""
+        bell = self._bells.pop(bell_id, None)
+        if bell is None:
+            return
+        del self._keys[bisect.bisect_left(self._keys, _sort_key(bell))]
+        for index, values in (
+            (self._by_day, set(bell.days)),
+            (self._by_speaker, bell.speakers),
+        ):
+            for value in values:
+                index[value].discard(bell_id)
+                if not index[value]:
+                    del index[value]
+        self._enabled.discard(bell_id)
+        self._disabled.discard(bell_id)
+        del self._text[bell_id]
+
+    def query(
+        self,
+        text=None,
+        day=None,
+        speaker=None,
+        enabled=None,
+        cursor=None,
+        limit=50,
+    ):
+        """Return ``(bell_ids, next_cursor)`` for one page of matches.
+
+        Matches are ordered by time of day. ``next_cursor`` is None on
+        the last page.
+        """
+        sets = []
+        if day is not None:
+            sets.append(self._by_day.get(day, set()))
+        if speaker is not None:
+            sets.append(self._by_speaker.get(speaker, set()))
+        if enabled is not None:
+            sets.append(self._enabled if enabled else self._disabled)
+
+        if sets:
+            sets.sort(key=len)
+            candidates = sets[0].intersection(*sets[1:])
+            keys = sorted(_sort_key(self._bells[i]) for i in candidates)
+        else:
+            keys = self._keys
+
+        start = 0
+        if cursor:
+            start = bisect.bisect_right(keys, decode_cursor(cursor))
+        needle = text.lower() if text else None
+
+        page = []
+        last_key = None
+        for i in range(start, len(keys)):
+            bell_id = keys[i][2]
+            if needle and needle not in self._text[bell_id]:
+                continue
+            if len(page) == limit:
+                return page, encode_cursor(last_key)
+            page.append(bell_id)
+            last_key = keys[i]
+        return page, None
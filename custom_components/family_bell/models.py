@@ -0,0 +1,197 @@
+"""Data model for Family Bell.
+
+Bells and vacation ranges are parsed once, when loaded from the Store or
+received over the websocket, and serialize back to the persisted JSON
+shape. Validation happens on write (see ``BELL_SCHEMA``); parsing only
+raises ``KeyError``/``ValueError`` for data that cannot be a bell.
+"""
+
+from dataclasses import dataclass, field
+import bisect
+import datetime
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_WEEKDAY_BITS = {day: 1 << i for i, day in enumerate(WEEKDAYS)}
+
+
+def day_mask(days):
+    """Return the weekday bitmask (bit 0 = Monday) for a list of days."""
+    mask = 0
+    for day in days:
+        mask |= _WEEKDAY_BITS.get(day, 0)
+    return mask
+
+
+def _parse_sound(sound):
+    """Return ``(media_content_id, media_content_type)`` for a bell sound."""
+    if isinstance(sound, dict):
+        return (
+            sound.get("media_content_id") or None,
+            sound.get("media_content_type") or "music",
+        )
+    if isinstance(sound, str) and sound:
+        return sound, "music"
+    return None, "music"
+
+
+@dataclass(frozen=True, slots=True)
+class Bell:
+    """A single scheduled announcement."""
+
+    id: str
+    name: str
+    time: str
+    days: tuple
+    message: str
+    enabled: bool
+    speakers: tuple
+    tts_provider: str | None = None
+    tts_voice: str | None = None
+    tts_language: str | None = None
+    sound: str | dict | None = None
+    # Seconds to warm up before firing; None uses the global setting
+    lead_time: int | None = None
+
+    # Derived once in __post_init__
+    hour: int = field(init=False, repr=False, compare=False)
+    minute: int = field(init=False, repr=False, compare=False)
+    day_mask: int = field(init=False, repr=False, compare=False)
+    media_content_id: str | None = field(init=False, repr=False, compare=False)
+    media_content_type: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        hour, minute = map(int, self.time.split(":"))
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"Invalid time of day: {self.time}")
+        object.__setattr__(self, "hour", hour)
+        object.__setattr__(self, "minute", minute)
+        object.__setattr__(self, "day_mask", day_mask(self.days))
+        media_id, media_type = _parse_sound(self.sound)
+        object.__setattr__(self, "media_content_id", media_id)
+        object.__setattr__(self, "media_content_type", media_type)
+
+    @property
+    def timing(self):
+        """Return ``(hour, minute, day_mask)`` for the scheduler."""
+        return self.hour, self.minute, self.day_mask
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a bell from its stored or websocket form."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            time=data["time"],
+            days=tuple(data["days"]),
+            message=data["message"],
+            enabled=data["enabled"],
+            # Drop duplicate speakers, keeping their order
+            speakers=tuple(dict.fromkeys(data["speakers"])),
+            # Empty strings mean "use the global setting"
+            tts_provider=data.get("tts_provider") or None,
+            tts_voice=data.get("tts_voice") or None,
+            tts_language=data.get("tts_language") or None,
+            sound=data.get("sound"),
+            lead_time=data.get("lead_time"),
+        )
+
+    def to_dict(self):
+        """Return the bell in its persisted JSON shape."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "time": self.time,
+            "days": list(self.days),
+            "message": self.message,
+            "enabled": self.enabled,
+            "speakers": list(self.speakers),
+            "tts_provider": self.tts_provider,
+            "tts_voice": self.tts_voice,
+            "tts_language": self.tts_language,
+            "sound": self.sound,
+            "lead_time": self.lead_time,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class VacationRange:
+    """An inclusive range of vacation days."""
+
+    start: datetime.date
+    end: datetime.date
+
+    @classmethod
+    def from_dict(cls, data):
+        """Parse a stored range; return None if it is malformed."""
+        try:
+            return cls(
+                datetime.date.fromisoformat(data["start"]),
+                datetime.date.fromisoformat(data["end"]),
+            )
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def to_dict(self):
+        """Return the range in its persisted JSON shape."""
+        return {"start": self.start.isoformat(), "end": self.end.isoformat()}
+
+
+@dataclass(frozen=True, slots=True)
+class Vacation:
+    """Vacation mode settings with a sorted, merged interval index.
+
+    Overlapping and back-to-back ranges are merged once, when the
+    vacation data changes, so day queries are a single bisection and a
+    whole break can be skipped in one step.
+    """
+
+    enabled: bool = False
+    ranges: tuple = ()
+
+    # Derived once in __post_init__: parallel tuples of merged ranges
+    _starts: tuple = field(init=False, repr=False, compare=False)
+    _ends: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        starts = []
+        ends = []
+        one_day = datetime.timedelta(days=1)
+        for r in sorted(self.ranges, key=lambda r: r.start):
+            if r.end < r.start:
+                continue
+            if ends and r.start <= ends[-1] + one_day:
+                ends[-1] = max(ends[-1], r.end)
+            else:
+                starts.append(r.start)
+                ends.append(r.end)
+        object.__setattr__(self, "_starts", tuple(starts))
+        object.__setattr__(self, "_ends", tuple(ends))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Parse the stored vacation block, skipping malformed ranges."""
+        ranges = (VacationRange.from_dict(r) for r in data.get("ranges", []))
+        return cls(
+            enabled=bool(data.get("enabled")),
+            ranges=tuple(r for r in ranges if r is not None),
+        )
+
+    def _range_index(self, day):
+        """Return the index of the merged range containing ``day``."""
+        if not self.enabled:
+            return None
+        i = bisect.bisect_right(self._starts, day) - 1
+        if i >= 0 and day <= self._ends[i]:
+            return i
+        return None
+
+    def contains(self, day):
+        """Return True if vacation mode is on and ``day`` is in a range."""
+        return self._range_index(day) is not None
+
+    def next_non_vacation_day(self, day):
+        """Return ``day``, or the first day after the break containing it."""
+        i = self._range_index(day)
+        if i is None:
+            return day
+        return self._ends[i] + datetime.timedelta(days=1)
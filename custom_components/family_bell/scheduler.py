@@ -0,0 +1,401 @@
+"""Timer engine for Family Bell.
+
+All enabled bells live in a single min-heap ordered by their next fire
+time. Only one Home Assistant timer is armed at any moment, for the
+earliest entry; when it fires the due bells are popped, rung and pushed
+back with their following fire time. Fire times already skip vacation
+days, so bells come back on their own once a break ends.
+"""
+
+import datetime
+import heapq
+import itertools
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .models import Vacation
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# _DAY_OFFSETS[mask][weekday] is the number of days from ``weekday`` to the
+# first weekday set in ``mask`` (0 if ``weekday`` itself is set).
+_DAY_OFFSETS = tuple(
+    tuple(
+        next((k for k in range(7) if mask >> ((wd + k) % 7) & 1), None)
+        for wd in range(7)
+    )
+    for mask in range(1 << 7)
+)
+
+
+def next_fire_time(timing, now, vacation=None):
+    """Return the first time after ``now`` on one of the bell's days.
+
+    Days inside ``vacation`` are skipped a whole break at a time. Returns
+    None when the bell has no days selected.
+    """
+    next_run = _next_matching_time(timing, now)
+    while vacation is not None and next_run is not None:
+        day = next_run.date()
+        resume = vacation.next_non_vacation_day(day)
+        if resume == day:
+            break
+        # Search again from just before midnight at the end of the break
+        start_of_day = datetime.datetime.combine(
+            resume, datetime.time(), tzinfo=next_run.tzinfo
+        )
+        next_run = _next_matching_time(
+            timing, start_of_day - datetime.timedelta(microseconds=1)
+        )
+    return next_run
+
+
+def _next_matching_time(timing, now):
+    """Return the first time after ``now`` on one of the bell's days."""
+    b_hour, b_minute, mask = timing
+    if not mask:
+        return None
+    next_run = now.replace(
+        hour=b_hour, minute=b_minute, second=0, microsecond=0
+    )
+    if next_run <= now:
+        next_run += datetime.timedelta(days=1)
+    offset = _DAY_OFFSETS[mask][next_run.weekday()]
+    if offset:
+        next_run += datetime.timedelta(days=offset)
+    return next_run
+
+
+class BellScheduler:
+    """Priority queue of (next_fire, bell_id) backed by a single timer.
+
+    Bells with a lead time also get a warm-up entry in a second heap,
+    ``lead`` seconds before they fire. The one timer is armed for
+    whichever of the two heads comes first.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fire_callback,
+        prepare_callback,
+        warm_up_callback=None,
+        lead_time=None,
+        update_callback=None,
+    ):
+        self._hass = hass
+        # Called with the list of bells due in the same tick, in queue order
+        self._fire_callback = fire_callback
+        # Called with the bells due next whenever that group changes, so
+        # their audio can be rendered ahead of time.
+        self._prepare_callback = prepare_callback
+        # Called with bells ``lead_time(bell)`` seconds before they fire
+        self._warm_up_callback = warm_up_callback
+        self._lead_time = lead_time
+        # Called without arguments when the next fire or the number of
+        # queued bells changes
+        self._update_callback = update_callback
+        self._heap = []
+        self._warm_heap = []
+        # bell_id -> heap entry currently considered live. Entries that are
+        # no longer referenced here are stale and skipped when popped.
+        self._entries = {}
+        self._warm_entries = {}
+        self._bells = {}
+        # Bells whose entry was pushed back by a vacation
+        self._postponed = set()
+        self._vacation = Vacation()
+        self._counter = itertools.count()
+        self._unsub = None
+        self._armed_for = None
+        self._prepared_for = None
+        self._notified = None
+
+    @property
+    def scheduled_count(self):
+        """Return the number of bells currently in the queue."""
+        return len(self._entries)
+
+    def next_fire(self):
+        """Return the next fire time and the bells due then."""
+        if not self._heap:
+            return None, []
+        return self._heap[0][0], self._head_bells()
+
+    def upcoming(self, limit):
+        """Return the next ``limit`` fires as ``(fire_time, bell)`` pairs.
+
+        The live queue entries are merged lazily: only the bell taken off
+        the top is advanced to its following fire, so the answer costs one
+        heap copy plus ``limit`` steps whatever the number of bells.
+        Vacation days are skipped like for real fires.
+        """
+        heap = [e for e in self._heap if self._entries.get(e[2]) is e]
+        heapq.heapify(heap)
+        fires = []
+        while heap and len(fires) < limit:
+            fire_time, seq, bell_id = heap[0]
+            bell = self._bells[bell_id]
+            fires.append((fire_time, bell))
+            following = next_fire_time(bell.timing, fire_time, self._vacation)
+            heapq.heapreplace(heap, (following, seq, bell_id))
+        return fires
+
+    @callback
+    def async_load(self, bells, vacation):
+        """Replace the queue with the given bells and re-arm the timer."""
+        self._reset()
+        self._vacation = vacation
+        now = dt_util.now()
+        for bell in bells:
+            self._push(bell, now, bulk=True)
+        heapq.heapify(self._heap)
+        heapq.heapify(self._warm_heap)
+        self._async_arm()
+
+    @callback
+    def async_clear(self):
+        """Drop every queued bell."""
+        self._reset()
+        self._async_arm()
+
+    @callback
+    def async_stop(self):
+        """Cancel the armed timer and drop the queue."""
+        self.async_clear()
+
+    def _reset(self):
+        """Empty every queue."""
+        self._heap = []
+        self._warm_heap = []
+        self._entries = {}
+        self._warm_entries = {}
+        self._bells = {}
+        self._postponed = set()
+        self._prepared_for = None
+
+    @callback
+    def async_set_vacation(self, vacation):
+        """Apply new vacation settings to the entries they affect.
+
+        Only bells that were postponed by the old vacation, or whose next
+        fire falls inside the new one, are re-queued.
+        """
+        self._vacation = vacation
+        affected = [
+            self._bells[bell_id]
+            for bell_id, entry in self._entries.items()
+            if bell_id in self._postponed or vacation.contains(entry[0].date())
+        ]
+        _LOGGER.debug("Vacation changed, re-queueing %d bells", len(affected))
+        self.async_update_bells(affected)
+
+    @callback
+    def async_update_bell(self, bell):
+        """Queue or re-queue a single bell after it was added or edited."""
+        self.async_update_bells([bell])
+
+    @callback
+    def async_update_bells(self, bells):
+        """Re-queue several bells, re-arming the timer once."""
+        now = dt_util.now()
+        pushed = []
+        for bell in bells:
+            self._discard(bell.id)
+            if bell.enabled and self._push(bell, now):
+                pushed.append(bell)
+        # An edit can change the next bell without moving the head
+        self._notified = None
+        self._async_compact()
+        self._async_arm()
+        if self._prepared_for is not None:
+            # Prepare edited bells that joined the group due next
+            self._async_prepare(
+                [
+                    b
+                    for b in pushed
+                    if self._entries[b.id][0] == self._prepared_for
+                ]
+            )
+
+    @callback
+    def async_remove_bell(self, bell_id):
+        """Drop a single bell from the queue."""
+        self.async_remove_bells([bell_id])
+
+    @callback
+    def async_remove_bells(self, bell_ids):
+        """Drop several bells from the queue, re-arming the timer once."""
+        for bell_id in bell_ids:
+            self._discard(bell_id)
+        self._async_compact()
+        self._async_arm()
+
+    def _discard(self, bell_id):
+        """Forget a bell's live entries, leaving them stale in the heaps."""
+        if self._entries.pop(bell_id, None) is not None:
+            del self._bells[bell_id]
+            self._postponed.discard(bell_id)
+            self._warm_entries.pop(bell_id, None)
+
+    def _async_compact(self):
+        """Rebuild a heap once its stale entries outnumber live ones."""
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+        if len(self._warm_heap) > 2 * len(self._warm_entries) + 16:
+            self._warm_heap = list(self._warm_entries.values())
+            heapq.heapify(self._warm_heap)
+
+    def _push(self, bell, now, bulk=False):
+        """Queue a bell's next fire (and warm-up) after ``now``.
+
+        With ``bulk`` the heap invariant is left to the caller. Returns
+        False, and adds nothing, if the bell never rings.
+        """
+        fire_time = _next_matching_time(bell.timing, now)
+        if fire_time is None:
+            return False
+        if self._vacation.contains(fire_time.date()):
+            fire_time = next_fire_time(bell.timing, now, self._vacation)
+            self._postponed.add(bell.id)
+        else:
+            self._postponed.discard(bell.id)
+
+        add = list.append if bulk else heapq.heappush
+        entry = (fire_time, next(self._counter), bell.id)
+        self._entries[bell.id] = entry
+        self._bells[bell.id] = bell
+        add(self._heap, entry)
+
+        lead = self._lead_time(bell) if self._lead_time else 0
+        warm_at = fire_time - datetime.timedelta(seconds=lead)
+        if lead and warm_at > now:
+            warm_entry = (warm_at, entry[1], bell.id)
+            self._warm_entries[bell.id] = warm_entry
+            add(self._warm_heap, warm_entry)
+        else:
+            self._warm_entries.pop(bell.id, None)
+        return True
+
+    def _head_bells(self):
+        """Return the live bells sharing the earliest fire time.
+
+        Entries equal to the heap minimum form a subtree rooted at the
+        top, so only that subtree is walked.
+        """
+        heap = self._heap
+        if not heap:
+            return []
+        head = heap[0][0]
+        bells = []
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            if i >= len(heap) or heap[i][0] != head:
+                continue
+            entry = heap[i]
+            if self._entries.get(entry[2]) is entry:
+                bells.append(self._bells[entry[2]])
+            stack.extend((2 * i + 1, 2 * i + 2))
+        return bells
+
+    @callback
+    def _async_prepare(self, bells):
+        """Let the integration get ready for bells that are due next."""
+        if bells:
+            self._hass.async_create_task(self._prepare_callback(bells))
+
+    @staticmethod
+    def _drop_stale_head(heap, entries):
+        """Pop stale entries sitting at the top of a heap."""
+        while heap and entries.get(heap[0][2]) is not heap[0]:
+            heapq.heappop(heap)
+
+    @staticmethod
+    def _pop_due(heap, entries, now):
+        """Pop the live entries due at ``now``; return their bell ids."""
+        due = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if entries.get(entry[2]) is entry:
+                del entries[entry[2]]
+                due.append(entry[2])
+        return due
+
+    @callback
+    def _async_arm(self):
+        """Arm the timer for the earliest live entry, if it changed."""
+        self._drop_stale_head(self._heap, self._entries)
+        self._drop_stale_head(self._warm_heap, self._warm_entries)
+        fire_head = self._heap[0][0] if self._heap else None
+        heads = [fire_head] if fire_head else []
+        if self._warm_heap:
+            heads.append(self._warm_heap[0][0])
+        head = min(heads, default=None)
+
+        if fire_head != self._prepared_for:
+            self._prepared_for = fire_head
+            self._async_prepare(self._head_bells())
+
+        state = (fire_head, len(self._entries))
+        if state != self._notified:
+            self._notified = state
+            if self._update_callback:
+                self._update_callback()
+
+        if head == self._armed_for and (head is None or self._unsub):
+            return
+
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        self._armed_for = head
+
+        if head is None:
+            _LOGGER.debug("No bells scheduled")
+            return
+
+        _LOGGER.debug(
+            "Arming timer for %s (%d bells queued)", head, len(self._entries)
+        )
+        self._unsub = async_track_point_in_utc_time(
+            self._hass, self._async_timer_fired, head
+        )
+
+    @callback
+    def _async_timer_fired(self, now):
+        """Ring or warm up every due bell, re-queue them and re-arm."""
+        self._unsub = None
+        self._armed_for = None
+        now = max(now, dt_util.utcnow())
+
+        warming = [
+            self._bells[bell_id]
+            for bell_id in self._pop_due(
+                self._warm_heap, self._warm_entries, now
+            )
+        ]
+        if warming:
+            self._hass.async_create_task(self._warm_up_callback(warming))
+
+        due = []
+        for bell_id in self._pop_due(self._heap, self._entries, now):
+            due.append(self._bells.pop(bell_id))
+            # A warm-up that did not get its turn is moot now
+            self._warm_entries.pop(bell_id, None)
+
+        local_now = dt_util.as_local(now)
+        for bell in due:
+            # Days never change between fires, so the next time exists
+            self._push(bell, local_now)
+
+        if due:
+            # One batch, so bells sharing speakers can be queued together
+            self._hass.async_create_task(self._fire_callback(due))
+
+        self._async_arm()
@@ -0,0 +1,99 @@
+"""Sensors for Family Bell, pushed by the scheduler."""
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_SCHEDULE_UPDATED
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities
+):
+    """Set up the Family Bell sensors."""
+    async_add_entities([NextBellSensor(entry), ScheduledBellsSensor(entry)])
+
+
+def _next_bell_attributes(scheduler):
+    """Describe the bells due at the next fire."""
+    bells = scheduler.next_fire()[1]
+    return {
+        "bell_name": ", ".join(bell.name for bell in bells) or None,
+        "bell_ids": [bell.id for bell in bells],
+        "message": bells[0].message if len(bells) == 1 else None,
+    }
+
+
+class FamilyBellSensor(SensorEntity):
+    """Base for sensors updated from the scheduler queue.
+
+    Nothing is polled: the scheduler signals when the next fire or the
+    number of queued bells changes, and only then is the state written.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self, entry: ConfigEntry, key: str, value_fn, attributes_fn=None
+    ):
+        self._value_fn = value_fn
+        self._attributes_fn = attributes_fn
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Family Bell",
+        )
+
+    async def async_added_to_hass(self):
+        """Start listening to the scheduler."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_SCHEDULE_UPDATED, self._async_updated
+            )
+        )
+        self._update_from(self.hass.data[DOMAIN]["scheduler"])
+
+    @callback
+    def _async_updated(self):
+        """Refresh the state after the schedule changed."""
+        self._update_from(self.hass.data[DOMAIN]["scheduler"])
+        self.async_write_ha_state()
+
+    def _update_from(self, scheduler):
+        """Set the state from the scheduler."""
+        self._attr_native_value = self._value_fn(scheduler)
+        if self._attributes_fn is not None:
+            self._attr_extra_state_attributes = self._attributes_fn(scheduler)
+
+
+class NextBellSensor(FamilyBellSensor):
+    """When the next bell rings, and which bell it is."""
+
+    _attr_name = "Next bell"
+    _attr_icon = "mdi:bell-ring"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, entry: ConfigEntry):
+        super().__init__(
+            entry,
+            "next_bell",
+            lambda scheduler: scheduler.next_fire()[0],
+            _next_bell_attributes,
+        )
+
+
+class ScheduledBellsSensor(FamilyBellSensor):
+    """How many bells are scheduled."""
+
+    _attr_name = "Scheduled bells"
+    _attr_icon = "mdi:bell-outline"
+
+    def __init__(self, entry: ConfigEntry):
+        super().__init__(
+            entry,
+            "scheduled_bells",
+            lambda scheduler: scheduler.scheduled_count,
+        )
@@ -0,0 +1,166 @@
+"""Persistence helpers for Family Bell."""
+
+import logging
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .index import BellIndex
+from .models import Bell, Vacation
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for further edits before writing the document
+SAVE_DELAY = 2
+
+
+class BellStorage:
+    """In-memory bell data with coalesced Store writes.
+
+    Bells are held as parsed ``Bell`` models in a dict keyed by id
+    (insertion ordered), so lookups, upserts and deletes are constant
+    time; the persisted document keeps its ``bells`` list, which is
+    rebuilt only when writing. A ``BellIndex`` over the same bells serves
+    filtered listings. The vacation block is kept as stored, with
+    a parsed ``Vacation`` alongside it.
+
+    Edits mark the document dirty and (re)start a short delay via
+    ``Store.async_delay_save``; only the last edit in a burst is written.
+    Home Assistant flushes pending delayed saves itself at shutdown, and
+    ``async_flush`` covers unloading the config entry.
+
+    Edits are also tracked for live subscribers: ``pop_changes`` returns
+    the bells and keys changed since its last call, under a new
+    revision.
+    """
+
+    def __init__(self, store: Store, data: dict):
+        self.store = store
+        self.bells = {}
+        for item in data.pop("bells", []):
+            try:
+                bell = Bell.from_dict(item)
+            except (AttributeError, KeyError, TypeError, ValueError) as err:
+                # Written by an older version that validated less
+                _LOGGER.warning("Skipping malformed bell %s: %s", item, err)
+                continue
+            self.bells[bell.id] = bell
+        self.index = BellIndex(self.bells.values())
+        # Everything but the bells (vacation, last_defaults, ...)
+        self.data = data
+        self.vacation = Vacation.from_dict(data.get("vacation", {}))
+        # Seeded from the clock so revisions keep increasing across
+        # restarts without being persisted
+        self.revision = time.time_ns() // 1_000_000
+        # Ordered set of upserted bell ids
+        self._changed_bells = {}
+        self._deleted_bells = set()
+        self._changed_keys = set()
+        self.dirty = False
+        self.saves_requested = 0
+        self.saves_coalesced = 0
+        self.writes = 0
+
+    def get_bell(self, bell_id):
+        """Return a bell by id, or None."""
+        return self.bells.get(bell_id)
+
+    def upsert_bell(self, bell):
+        """Add a bell, or replace the bell with the same id in place."""
+        self.bells[bell.id] = bell
+        self.index.add(bell)
+        self._changed_bells[bell.id] = None
+        self._deleted_bells.discard(bell.id)
+
+    def remove_bell(self, bell_id):
+        """Remove a bell; return False if it did not exist."""
+        if self.bells.pop(bell_id, None) is None:
+            return False
+        self.index.remove(bell_id)
+        self._changed_bells.pop(bell_id, None)
+        self._deleted_bells.add(bell_id)
+        return True
+
+    def set_value(self, key, value):
+        """Set a top-level key of the document (e.g. ``last_defaults``)."""
+        self.data[key] = value
+        self._changed_keys.add(key)
+
+    def set_vacation(self, vacation):
+        """Replace the vacation block."""
+        self.set_value("vacation", vacation)
+        self.vacation = Vacation.from_dict(vacation)
+
+    def bump_revision(self):
+        """Start a new revision and return it."""
+        self.revision += 1
+        return self.revision
+
+    def pop_changes(self):
+        """Return the edits since the last call as a delta, or None.
+
+        The delta holds the new revision, the changed bells, the ids of
+        deleted bells and any changed top-level keys.
+        """
+        if not (
+            self._changed_bells or self._deleted_bells or self._changed_keys
+        ):
+            return None
+        delta = {
+            "revision": self.bump_revision(),
+            "bells": [
+                self.bells[bell_id].to_dict()
+                for bell_id in self._changed_bells
+            ],
+            "deleted": sorted(self._deleted_bells),
+        }
+        for key in self._changed_keys:
+            delta[key] = self.data[key]
+        self._changed_bells.clear()
+        self._deleted_bells.clear()
+        self._changed_keys.clear()
+        return delta
+
+    def as_dict(self):
+        """Return the document in its persisted shape."""
+        return {
+            **self.data,
+            "bells": [bell.to_dict() for bell in self.bells.values()],
+        }
+
+    @callback
+    def async_schedule_save(self):
+        """Mark the data dirty and write it once the burst settles."""
+        self.saves_requested += 1
+        if self.dirty:
+            self.saves_coalesced += 1
+        self.dirty = True
+        self.store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self):
+        """Return the document to persist; called by the Store."""
+        self.dirty = False
+        self.writes += 1
+        _LOGGER.debug(
+            "Writing bell data (%d saves coalesced so far)",
+            self.saves_coalesced,
+        )
+        return self.as_dict()
+
+    async def async_flush(self):
+        """Write pending edits right away."""
+        if not self.dirty:
+            return
+        # async_save cancels the pending delayed write
+        await self.store.async_save(self._data_to_save())
+
+    def stats(self):
+        """Return write-coalescing counters."""
+        return {
+            "saves_requested": self.saves_requested,
+            "saves_coalesced": self.saves_coalesced,
+            "writes": self.writes,
+            "pending": self.dirty,
+        }
@@ -0,0 +1,121 @@
+"""Pre-rendered TTS audio for recurring bell messages."""
+
+from collections import Counter, OrderedDict
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+try:
+    from homeassistant.components.tts import (
+        async_get_media_source_audio,
+        generate_media_source_id,
+    )
+except ImportError:
+    async_get_media_source_audio = None
+    generate_media_source_id = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of distinct announcements kept ready to play
+CACHE_SIZE = 64
+
+
+def tts_cache_key(message, provider, voice, language):
+    """Return the cache key for an announcement."""
+    return (message, provider, voice, language)
+
+
+class TTSCache:
+    """LRU of rendered announcements.
+
+    Entries are keyed by (message, provider, voice, language), so bells
+    sharing an announcement share one rendering.
+
+    Rendering goes through the TTS media source with ``cache=True``, so
+    the audio itself is kept by the TTS integration; this cache maps each
+    announcement to its ready-to-play media source id. Playing that id
+    with ``media_player.play_media`` skips synthesis at fire time.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_size=CACHE_SIZE):
+        self._hass = hass
+        self._max_size = max_size
+        self._media = OrderedDict()
+        self._keys_by_bell = {}
+        self._bells_per_key = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._media)
+
+    @callback
+    def get(self, key):
+        """Return the media source id for a rendered announcement."""
+        media_id = self._media.get(key)
+        if media_id is None:
+            self.misses += 1
+            return None
+        self._media.move_to_end(key)
+        self.hits += 1
+        return media_id
+
+    async def async_prepare(self, bell_id, key):
+        """Render an announcement ahead of time; return its media id.
+
+        Returns None if the TTS integration is unavailable or rendering
+        failed, in which case the bell falls back to ``tts.speak``.
+        """
+        old_key = self._keys_by_bell.get(bell_id)
+        if old_key != key:
+            self._release(old_key)
+            self._keys_by_bell[bell_id] = key
+            self._bells_per_key[key] += 1
+        if key in self._media:
+            self._media.move_to_end(key)
+            return self._media[key]
+        if generate_media_source_id is None:
+            return None
+
+        message, provider, voice, language = key
+        try:
+            media_id = generate_media_source_id(
+                self._hass,
+                message,
+                engine=provider,
+                language=language,
+                options={"voice": voice} if voice else None,
+                cache=True,
+            )
+            await async_get_media_source_audio(self._hass, media_id)
+        except Exception as e:
+            _LOGGER.debug("Could not pre-render TTS for %s: %s", bell_id, e)
+            return None
+
+        self._media[key] = media_id
+        while len(self._media) > self._max_size:
+            self._media.popitem(last=False)
+        _LOGGER.debug("Pre-rendered TTS for %s", bell_id)
+        return media_id
+
+    @callback
+    def invalidate_bell(self, bell_id):
+        """Forget the announcement rendered for an edited or deleted bell."""
+        self._release(self._keys_by_bell.pop(bell_id, None))
+
+    def _release(self, key):
+        """Drop a rendering once no bell uses it any more."""
+        if key is None:
+            return
+        self._bells_per_key[key] -= 1
+        if self._bells_per_key[key] <= 0:
+            del self._bells_per_key[key]
+            self._media.pop(key, None)
+
+    def stats(self):
+        """Return cache counters."""
+        return {
+            "size": len(self._media),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
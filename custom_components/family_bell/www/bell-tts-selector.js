@@ -3,6 +3,7 @@ import {
   html,
   css,
 } from "./lit-element.js";
+import { entityCatalog } from "./src/entity-catalog.js";
 
 export class BellTTSSelector extends LitElement {
   static get properties() {
@@ -33,10 +34,11 @@ export class BellTTSSelector extends LitElement {
 
   updated(changedProperties) {
     if (changedProperties.has("hass") && this.hass) {
-        // If hass changes, and we don't have providers, fetch them.
-        if (this._providers.length === 0) {
-            this._fetchProviders();
-
+        // The catalog is cached, so this only re-renders when a TTS
+        // entity was added, removed or renamed.
+        const hadProviders = this._providers.length > 0;
+        this._fetchProviders();
+        if (!hadProviders && this._providers.length > 0) {
             // If we have a provider selected, we should also try to fetch its details
             // now that hass is available and providers are initialized.
             if (this.provider) {
@@ -54,20 +56,12 @@ export class BellTTSSelector extends LitElement {
 
   _fetchProviders() {
     if (!this.hass || !this.hass.states) return;
-    this._providers = Object.keys(this.hass.states)
-      .filter((eid) => eid.startsWith("tts."))
-      .map((eid) => ({
-        id: eid,
-        name: this.hass.states[eid].attributes.friendly_name || eid,
-        languages: this.hass.states[eid].attributes.supported_languages || [],
-      }))
-      .sort((a, b) => a.name.localeCompare(b.name));
-    this.requestUpdate();
+    this._providers = entityCatalog(this.hass, "tts");
   }
 
   _updateLanguages(providerId) {
-    const provider = this._providers.find((p) => p.id === providerId);
-    this._languages = provider ? provider.languages : [];
+    const state = this.hass && this.hass.states && this.hass.states[providerId];
+    this._languages = (state && state.attributes.supported_languages) || [];
 
     // Reset language if current is not supported, or default to first
     if (this._languages.length > 0 && !this._languages.includes(this.language)) {
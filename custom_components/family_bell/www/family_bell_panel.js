@@ -7,6 +7,7 @@ import "./src/bell-card.js";
 import "./src/vacation-card.js";
 import "./src/bell-form.js";
 import "./bell-tts-selector.js";
+import { localize } from "./src/localize.js";
 
 console.info(
   `%c 🔔 Family Bell 🔔 %c ${new URL(import.meta.url).searchParams.get("v") || "unknown"}`,
@@ -14,6 +15,27 @@ console.info(
   "color: #e0ab0a; font-weight: 700;"
 );
 
+// Above this many bells only the rows near the viewport are rendered
+const WINDOW_THRESHOLD = 60;
+// Rows rendered beyond each edge of the viewport
+const OVERSCAN_ROWS = 4;
+// Row height used until a rendered row has been measured
+const ESTIMATED_ROW_HEIGHT = 180;
+// Must match the .bell-grid gap
+const GRID_GAP = 16;
+
+// Search text of each bell, built once per bell object
+const searchText = new WeakMap();
+
+function bellSearchText(bell) {
+  let text = searchText.get(bell);
+  if (text === undefined) {
+    text = `${bell.message}\n${bell.time}`.toLowerCase();
+    searchText.set(bell, text);
+  }
+  return text;
+}
+
 export class FamilyBellPanel extends LitElement {
   static get properties() {
     return {
@@ -27,6 +49,7 @@ export class FamilyBellPanel extends LitElement {
       _editingBell: { type: Object },
       _showAddForm: { type: Boolean },
       _filterText: { type: String },
+      _window: { type: Object },
     };
   }
 
@@ -41,34 +64,242 @@ export class FamilyBellPanel extends LitElement {
     this._editingBell = null;
     this._showAddForm = false;
     this._filterText = "";
+    // Rendered rows, [start, end), when the list is windowed
+    this._window = { start: 0, end: 8 };
+    this._rowHeight = ESTIMATED_ROW_HEIGHT;
+    this._onScroll = () => this._scheduleWindowUpdate();
+    this._onResize = () => {
+      // The number of columns may have changed
+      this.requestUpdate();
+      this._scheduleWindowUpdate();
+    };
   }
 
   firstUpdated() {
-    this.fetchData();
+    this._subscribe();
     this.addEventListener('edit-bell', this._handleEditBell);
     this.addEventListener('cancel-edit', this._handleCancelEdit);
     this.addEventListener('bell-saved', this._handleBellSaved);
+    this.addEventListener('save-bell', (e) => this._saveBell(e.detail.bell));
+    this.addEventListener('delete-bell', (e) => this._deleteBell(e.detail.bell_id));
+    this.addEventListener('save-vacation', (e) => this._saveVacation(e.detail.vacation));
   }
 
   updated(changedProperties) {
-    if (changedProperties.has("hass") && this.hass && !this.bells.length) {
-      if (!this._dataFetched) {
-         this.fetchData();
+    if (changedProperties.has("hass") && this.hass) {
+      this._subscribe();
+    }
+    if (this._windowed) {
+      this._measureRows();
+      if (changedProperties.has("bells") || changedProperties.has("_filterText")) {
+        this._scheduleWindowUpdate();
       }
     }
   }
 
+  connectedCallback() {
+    super.connectedCallback();
+    this._subscribe();
+    this._scroller = this._scrollParent();
+    this._scroller.addEventListener("scroll", this._onScroll, { passive: true });
+    window.addEventListener("resize", this._onResize, { passive: true });
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    this._unsubscribe();
+    this._scroller.removeEventListener("scroll", this._onScroll);
+    window.removeEventListener("resize", this._onResize);
+    cancelAnimationFrame(this._windowFrame);
+    this._windowFrame = null;
+  }
+
+  // Live updates: a snapshot first, then only what changed
+  _subscribe() {
+    if (!this.hass || this._unsubPromise) return;
+    this._unsubPromise = this.hass.connection.subscribeMessage(
+      (msg) => this._handleUpdate(msg),
+      { type: "family_bell/subscribe" }
+    );
+    this._unsubPromise.catch((err) => {
+      console.error("Family Bell: Error subscribing to updates", err);
+      this._unsubPromise = null;
+      this.fetchData();
+    });
+  }
+
+  _unsubscribe() {
+    if (!this._unsubPromise) return;
+    this._unsubPromise.then((unsub) => unsub()).catch(() => {});
+    this._unsubPromise = null;
+  }
+
+  _handleUpdate(msg) {
+    this._revision = msg.revision;
+    if (msg.snapshot) {
+      this._applyData(msg.snapshot);
+      return;
+    }
+    if (msg.bells || msg.deleted) {
+      const byId = new Map(this.bells.map((b) => [b.id, b]));
+      (msg.deleted || []).forEach((id) => byId.delete(id));
+      (msg.bells || []).forEach((b) => byId.set(b.id, b));
+      this.bells = [...byId.values()];
+    }
+    if (msg.vacation) this.vacation = msg.vacation;
+    if (msg.global_tts) this._globalTTS = msg.global_tts;
+    if (msg.last_defaults) this._lastDefaults = msg.last_defaults;
+  }
+
   fetchData() {
     if (!this.hass) return;
-    this.hass.callWS({ type: "family_bell/get_data" }).then((data) => {
-      this.bells = data.bells.sort((a, b) => a.time.localeCompare(b.time));
-      this.vacation = data.vacation;
-      this._dataFetched = true;
-      if (data.version) this._version = data.version;
-      if (data.global_tts) this._globalTTS = data.global_tts;
-      if (data.last_defaults) this._lastDefaults = data.last_defaults;
-      this.requestUpdate();
-    }).catch(err => console.error("Family Bell: Error fetching data", err));
+    const msg = { type: "family_bell/get_data" };
+    // The server only answers "unchanged" if we are up to date
+    if (this._revision !== undefined) msg.revision = this._revision;
+    this.hass.callWS(msg)
+      .then((data) => {
+        if (!data.unchanged) this._applyData(data);
+      })
+      .catch(err => console.error("Family Bell: Error fetching data", err));
+  }
+
+  _applyData(data) {
+    this._revision = data.revision;
+    this.bells = data.bells;
+    this.vacation = data.vacation;
+    this._dataFetched = true;
+    if (data.version) this._version = data.version;
+    if (data.global_tts) this._globalTTS = data.global_tts;
+    if (data.last_defaults) this._lastDefaults = data.last_defaults;
+    this.requestUpdate();
+  }
+
+  // Changes made here are shown right away and then sent. Once the
+  // server acknowledges, its delta has normally arrived already; a
+  // newer acknowledged revision means deltas were missed, so the data is
+  // fetched again. On error the change is undone, unless the server has
+  // sent a newer value in the meantime.
+  async _sendOptimistic(msg, undo) {
+    try {
+      const result = await this.hass.callWS(msg);
+      if (result && result.success === false) throw result.error;
+      if (result && result.revision > this._revision) this.fetchData();
+    } catch (err) {
+      console.error("Family Bell: Error saving change", err);
+      undo();
+      alert(`${localize("save_failed", this.hass)} ${(err && err.message) || ""}`);
+    }
+  }
+
+  _setBell(id, bell) {
+    const bells = this.bells.filter((b) => b.id !== id);
+    if (bell) bells.push(bell);
+    this.bells = bells;
+  }
+
+  _undoBell(id, previous, optimistic) {
+    return () => {
+      if ((this.bells.find((b) => b.id === id) || null) === optimistic) {
+        this._setBell(id, previous);
+      }
+    };
+  }
+
+  _saveBell(bell) {
+    const previous = this.bells.find((b) => b.id === bell.id) || null;
+    this._setBell(bell.id, bell);
+    this._sendOptimistic(
+      { type: "family_bell/update_bell", bell },
+      this._undoBell(bell.id, previous, bell)
+    );
+  }
+
+  _deleteBell(bellId) {
+    const previous = this.bells.find((b) => b.id === bellId) || null;
+    this._setBell(bellId, null);
+    this._sendOptimistic(
+      { type: "family_bell/delete_bell", bell_id: bellId },
+      this._undoBell(bellId, previous, null)
+    );
+  }
+
+  _saveVacation(vacation) {
+    const previous = this.vacation;
+    this.vacation = vacation;
+    this._sendOptimistic({ type: "family_bell/vacation", vacation }, () => {
+      if (this.vacation === vacation) this.vacation = previous;
+    });
+  }
+
+  // Bells sorted by time, then filtered. Each step is only redone when
+  // its input changes, not on every render.
+  _visibleBells() {
+    if (this._sortedFrom !== this.bells) {
+      this._sortedFrom = this.bells;
+      this._sorted = [...this.bells].sort((a, b) => a.time.localeCompare(b.time));
+    }
+    if (this._filteredFrom !== this._sorted || this._filteredBy !== this._filterText) {
+      this._filteredFrom = this._sorted;
+      this._filteredBy = this._filterText;
+      const txt = this._filterText.toLowerCase();
+      this._filtered = txt
+        ? this._sorted.filter((b) => bellSearchText(b).includes(txt))
+        : this._sorted;
+    }
+    return this._filtered;
+  }
+
+  // Mirrors the .bell-grid media queries
+  _columns() {
+    if (window.matchMedia("(min-width: 900px)").matches) return 3;
+    if (window.matchMedia("(min-width: 600px)").matches) return 2;
+    return 1;
+  }
+
+  // The nearest scrolling ancestor, looking through shadow roots
+  _scrollParent() {
+    let node = this;
+    while ((node = node.assignedSlot || node.parentNode || node.host)) {
+      if (node instanceof Element) {
+        const overflow = getComputedStyle(node).overflowY;
+        if (overflow === "auto" || overflow === "scroll") return node;
+      }
+    }
+    return window;
+  }
+
+  _scheduleWindowUpdate() {
+    if (this._windowFrame || !this._windowed) return;
+    this._windowFrame = requestAnimationFrame(() => {
+      this._windowFrame = null;
+      this._updateWindow();
+    });
+  }
+
+  // Render the rows in view plus an overscan on either side
+  _updateWindow() {
+    const list = this.shadowRoot.getElementById("bell-list");
+    if (!list) return;
+    const rows = Math.ceil(this._visibleBells().length / this._columns());
+    const first = Math.floor(-list.getBoundingClientRect().top / this._rowHeight);
+    const count = Math.ceil(window.innerHeight / this._rowHeight);
+    const start = Math.min(Math.max(first - OVERSCAN_ROWS, 0), rows);
+    const end = Math.min(Math.max(first + count + OVERSCAN_ROWS, start), rows);
+    if (start !== this._window.start || end !== this._window.end) {
+      this._window = { start, end };
+    }
+  }
+
+  // Size the spacers from the average height of the rendered rows
+  _measureRows() {
+    const grid = this.shadowRoot.querySelector(".bell-grid");
+    const rendered = this._window.end - this._window.start;
+    if (!grid || rendered <= 0) return;
+    const height = (grid.offsetHeight + GRID_GAP) / rendered;
+    if (height > 0 && Math.abs(height - this._rowHeight) > 1) {
+      this._rowHeight = height;
+      this._scheduleWindowUpdate();
+    }
   }
 
   _handleEditBell(e) {
@@ -95,8 +326,7 @@ export class FamilyBellPanel extends LitElement {
           voice: bell.tts_voice,
           language: bell.tts_language
       };
-
-      this.fetchData();
+      // The bell itself was already applied by _saveBell
   }
 
   render() {
@@ -104,15 +334,19 @@ export class FamilyBellPanel extends LitElement {
         return html`<div class="container"><p>Loading...</p></div>`;
     }
 
-    // Filter bells
-    let filteredBells = this.bells;
-    if (this._filterText) {
-        const txt = this._filterText.toLowerCase();
-        filteredBells = this.bells.filter(b =>
-            b.message.toLowerCase().includes(txt) ||
-            b.time.includes(txt)
-        );
+    const filteredBells = this._visibleBells();
+
+    // Window long lists; the spacers stand in for the rows not rendered
+    const columns = this._columns();
+    const rows = Math.ceil(filteredBells.length / columns);
+    this._windowed = filteredBells.length > WINDOW_THRESHOLD;
+    let start = 0;
+    let end = rows;
+    if (this._windowed) {
+      start = Math.min(this._window.start, rows);
+      end = Math.min(Math.max(this._window.end, start), rows);
     }
+    const shownBells = filteredBells.slice(start * columns, end * columns);
 
     return html`
       <div class="container" id="top-anchor">
@@ -156,10 +390,14 @@ export class FamilyBellPanel extends LitElement {
         <h3>Scheduled Bells (${filteredBells.length})</h3>
         ${filteredBells.length === 0 ? html`<p class="empty-state">No bells found.</p>` : ""}
 
-        <div class="bell-grid">
-           ${filteredBells.map((bell) => html`
-              <bell-card .hass=${this.hass} .bell=${bell}></bell-card>
-           `)}
+        <div id="bell-list">
+          <div style="height: ${start * this._rowHeight}px"></div>
+          <div class="bell-grid">
+             ${shownBells.map((bell) => html`
+                <bell-card .hass=${this.hass} .bell=${bell}></bell-card>
+             `)}
+          </div>
+          <div style="height: ${(rows - end) * this._rowHeight}px"></div>
         </div>
 
         <div class="footer">
@@ -100,12 +100,20 @@ class BellCard extends LitElement {
 
   toggleBellEnabled(enabled) {
     const updatedBell = { ...this.bell, enabled: enabled };
-    this.hass.callWS({ type: "family_bell/update_bell", bell: updatedBell });
+    this.dispatchEvent(new CustomEvent('save-bell', {
+        detail: { bell: updatedBell },
+        bubbles: true,
+        composed: true
+    }));
   }
 
   deleteBell() {
     if (!confirm(localize("delete_confirm", this.hass))) return;
-    this.hass.callWS({ type: "family_bell/delete_bell", bell_id: this.bell.id });
+    this.dispatchEvent(new CustomEvent('delete-bell', {
+        detail: { bell_id: this.bell.id },
+        bubbles: true,
+        composed: true
+    }));
   }
 
   editBell() {
@@ -4,6 +4,7 @@ import {
   css,
 } from "../lit-element.js";
 import { localize } from "./localize.js";
+import { entityCatalog } from "./entity-catalog.js";
 import "../bell-tts-selector.js";
 
 class BellForm extends LitElement {
@@ -177,23 +178,19 @@ class BellForm extends LitElement {
       this._tts = defaults ? { ...defaults } : { provider: "", voice: "", language: "" };
   }
 
+  // Filtered from the cached catalog; only redone when the speakers or
+  // the filter text change
   getMediaPlayers() {
-    if (!this.hass || !this.hass.states) return [];
-    let players = Object.keys(this.hass.states)
-      .filter((eid) => eid.startsWith("media_player."))
-      .map((eid) => {
-        return {
-          id: eid,
-          name: this.hass.states[eid].attributes.friendly_name || eid,
-        };
-      })
-      .sort((a, b) => a.name.localeCompare(b.name));
-
-    if (this._speakerFilter) {
+    const players = entityCatalog(this.hass, "media_player");
+    if (this._playersFrom !== players || this._playersFilter !== this._speakerFilter) {
+      this._playersFrom = players;
+      this._playersFilter = this._speakerFilter;
       const filter = this._speakerFilter.toLowerCase();
-      players = players.filter(p => p.name.toLowerCase().includes(filter) || p.id.toLowerCase().includes(filter));
+      this._players = filter
+        ? players.filter((p) => p.search.includes(filter))
+        : players;
     }
-    return players;
+    return this._players;
   }
 
   render() {
@@ -369,6 +366,8 @@ class BellForm extends LitElement {
         tts_voice: this._tts.voice,
         tts_language: this._tts.language,
         sound: this._soundEnabled ? this._sound : null,
+        // Not editable here yet; keep any per-bell override
+        lead_time: this.bell ? (this.bell.lead_time ?? null) : null,
     };
   }
 
@@ -379,15 +378,18 @@ class BellForm extends LitElement {
     }
     const bellData = this.getBellData();
 
-    this.hass.callWS({ type: "family_bell/update_bell", bell: bellData }).then(() => {
-        // Dispatch event so parent can close/reset
-        this.dispatchEvent(new CustomEvent('bell-saved', {
-            detail: { bell: bellData },
-            bubbles: true,
-            composed: true
-        }));
-        if (!this.bell) this._resetForm();
-    });
+    this.dispatchEvent(new CustomEvent('save-bell', {
+        detail: { bell: bellData },
+        bubbles: true,
+        composed: true
+    }));
+    // Dispatch event so parent can close/reset
+    this.dispatchEvent(new CustomEvent('bell-saved', {
+        detail: { bell: bellData },
+        bubbles: true,
+        composed: true
+    }));
+    if (!this.bell) this._resetForm();
   }
 
   testBell() {
@@ -0,0 +1,56 @@
+// Entity ids grouped by domain, built in one pass per hass.states object
+// and shared by every caller
+const domainIndex = new WeakMap();
+
+// domain -> the last catalog built for it
+const catalogs = new Map();
+
+function entityIdsByDomain(states) {
+  let index = domainIndex.get(states);
+  if (!index) {
+    index = new Map();
+    for (const entityId in states) {
+      const domain = entityId.slice(0, entityId.indexOf("."));
+      let ids = index.get(domain);
+      if (!ids) index.set(domain, (ids = []));
+      ids.push(entityId);
+    }
+    domainIndex.set(states, index);
+  }
+  return index;
+}
+
+function friendlyName(states, entityId) {
+  return states[entityId].attributes.friendly_name || entityId;
+}
+
+// Return the entities of a domain as { id, name, search }, sorted by
+// name. The same array is returned until an entity of the domain is
+// added, removed or renamed, so callers can memoize on it.
+export function entityCatalog(hass, domain) {
+  if (!hass || !hass.states) return [];
+  const states = hass.states;
+  const ids = entityIdsByDomain(states).get(domain) || [];
+
+  const cached = catalogs.get(domain);
+  if (cached && cached.states === states) return cached.entries;
+  if (
+    cached &&
+    cached.ids.length === ids.length &&
+    ids.every((id, i) => cached.ids[i] === id && cached.names[i] === friendlyName(states, id))
+  ) {
+    cached.states = states;
+    return cached.entries;
+  }
+
+  const names = ids.map((id) => friendlyName(states, id));
+  const entries = ids
+    .map((id, i) => ({
+      id,
+      name: names[i],
+      search: `${names[i]}\n${id}`.toLowerCase(),
+    }))
+    .sort((a, b) => a.name.localeCompare(b.name));
+  catalogs.set(domain, { states, ids, names, entries });
+  return entries;
+}
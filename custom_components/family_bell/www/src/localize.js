@@ -13,6 +13,7 @@ const languages = {
     what_to_say: "What should I say?",
     delete_confirm: "Delete this bell?",
     missing_fields: "Please fill in time, message, select at least one day and one speaker.",
+    save_failed: "Could not save the change.",
     speakers: "Speaker(s)",
     days: {
       mon: "Mon",
@@ -47,6 +48,7 @@ const languages = {
     what_to_say: "¿Qué debo decir?",
     delete_confirm: "¿Eliminar este timbre?",
     missing_fields: "Por favor complete la hora, el mensaje, seleccione al menos un día y un altavoz.",
+    save_failed: "No se pudo guardar el cambio.",
     speakers: "Altavoz(ces)",
     days: {
       mon: "Lun",
@@ -81,6 +83,7 @@ const languages = {
     what_to_say: "Que dois-je dire ?",
     delete_confirm: "Supprimer cette cloche ?",
     missing_fields: "Veuillez remplir l'heure, le message, sélectionner au moins un jour et un haut-parleur.",
+    save_failed: "Impossible d'enregistrer la modification.",
     speakers: "Haut-parleur(s)",
     days: {
       mon: "Lun",
@@ -176,7 +176,11 @@ class VacationCard extends LitElement {
   }
 
   _updateBackend(vacation) {
-    this.hass.callWS({ type: "family_bell/vacation", vacation: vacation });
+    this.dispatchEvent(new CustomEvent('save-vacation', {
+        detail: { vacation: vacation },
+        bubbles: true,
+        composed: true
+    }));
   }
 
 }
@@ -3,6 +3,7 @@
 import sys
 import pytest
 import threading
+from unittest.mock import MagicMock, patch
 
 # Force aiodns/pycares to be "not found" so aiohttp uses the standard resolver.
 # This prevents pycares from spawning a lingering thread (_run_safe_shutdown_loop)
@@ -22,8 +23,94 @@ def _mock_enumerate():
 
 threading.enumerate = _mock_enumerate
 
+# Mock hass_nabucasa to avoid 'josepy' dependency issues
+sys.modules["hass_nabucasa"] = MagicMock()
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations defined in the test dir."""
     yield
+
+
+@pytest.fixture
+def bell_data():
+    """Return a factory for bells as stored and sent over the websocket."""
+
+    def make(bell_id="1", time="08:00", **overrides):
+        return {
+            "id": bell_id,
+            "name": f"Bell {bell_id}",
+            "time": time,
+            "days": WEEKDAYS,
+            "message": f"Message {bell_id}",
+            "enabled": True,
+            "speakers": ["media_player.kitchen"],
+            **overrides,
+        }
+
+    return make
+
+
+@pytest.fixture
+def make_bell(bell_data):
+    """Return a factory for parsed bells."""
+    # Imported here so the aiodns/pycares patching above comes first
+    from custom_components.family_bell.models import Bell
+
+    def make(bell_id="1", time="08:00", **overrides):
+        return Bell.from_dict(bell_data(bell_id, time, **overrides))
+
+    return make
+
+
+@pytest.fixture
+def mock_storage(bell_data):
+    """Mock storage holding a single bell."""
+    with patch("custom_components.family_bell.Store") as mock_store:
+        store_instance = mock_store.return_value
+
+        async def async_load():
+            return {
+                "bells": [bell_data("existing", days=WEEKDAYS[:5])],
+                "vacation": {"enabled": False, "ranges": []},
+            }
+
+        store_instance.async_load.side_effect = async_load
+
+        yield store_instance
+
+
+@pytest.fixture
+async def ws_client(hass, hass_ws_client, mock_storage):
+    """Set up the integration and return a websocket client."""
+    # Imported here so the aiodns/pycares patching above comes first
+    from homeassistant.setup import async_setup_component
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.family_bell.const import DOMAIN
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"tts_provider": "tts.global"},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.family_bell.os.path.isdir", return_value=True
+    ), patch(
+        "custom_components.family_bell.os.path.isfile", return_value=True
+    ), patch(
+        "custom_components.family_bell.async_register_built_in_panel"
+    ), patch(
+        "custom_components.family_bell.add_extra_js_url"
+    ), patch.object(
+        hass.config, "path", return_value="/mock/path"
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+
+    return await hass_ws_client(hass)
@@ -0,0 +1,68 @@
+"""Test the shared announcement pipeline."""
+
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.family_bell.announcement import AnnouncementPipeline
+
+
+def _pipeline(hass, tts_cache):
+    entry = MagicMock()
+    entry.data = {"tts_provider": "tts.piper"}
+    entry.options = {"tts_voice": "amy", "tts_language": "en"}
+    return AnnouncementPipeline(hass, entry, tts_cache, MagicMock())
+
+
+async def test_payloads_are_built_once_per_bell(
+    hass: HomeAssistant, make_bell
+):
+    """Settings are resolved once and reused until the bell changes."""
+    tts_cache = MagicMock()
+    tts_cache.get.return_value = None
+    pipeline = _pipeline(hass, tts_cache)
+    bell = make_bell(sound="chime.mp3")
+
+    chime, speak = pipeline.steps(bell)
+    assert chime.data["media_content_id"] == "chime.mp3"
+    assert chime.optional
+    # Piper fails with 'en', so the language is dropped
+    assert speak.data == {
+        "entity_id": "tts.piper",
+        "message": "Message 1",
+        "options": {"voice": "amy"},
+    }
+    assert pipeline.steps(bell)[1] is speak
+    assert pipeline.stats()["built"] == 1
+
+    edited = make_bell(message="Bye")
+    assert pipeline.steps(edited)[0].data["message"] == "Bye"
+    assert pipeline.stats()["built"] == 2
+
+
+async def test_rendered_audio_replaces_speak(hass: HomeAssistant, make_bell):
+    """A pre-rendered announcement is played instead of tts.speak."""
+    tts_cache = MagicMock()
+    tts_cache.get.return_value = "media-source://tts/hello"
+    pipeline = _pipeline(hass, tts_cache)
+
+    (step,) = pipeline.steps(make_bell())
+    assert (step.domain, step.service) == ("media_player", "play_media")
+    assert step.data["media_content_id"] == "media-source://tts/hello"
+
+
+async def test_global_settings_are_cached_until_cleared(
+    hass: HomeAssistant, make_bell
+):
+    """Options are read once and re-read after an options update."""
+    pipeline = _pipeline(hass, MagicMock())
+    bell = make_bell()
+    assert pipeline.resolve(bell).voice == "amy"
+
+    pipeline._entry.options = {"tts_voice": "joe"}
+    assert pipeline.global_tts.voice == "amy"
+    assert pipeline.resolve(bell).voice == "amy"
+
+    pipeline.clear()
+    assert pipeline.global_tts.voice == "joe"
+    assert pipeline.resolve(bell).voice == "joe"
@@ -54,7 +54,10 @@ async def test_setup_entry_panel_removal_await(hass: HomeAssistant):
         ):
 
             # Mock schedule_bells to simplify test and avoid side effects
-            with patch("custom_components.family_bell.schedule_bells"):
+            # The entry is not loaded, so HA refuses to forward it
+            with patch(
+                "custom_components.family_bell.schedule_bells"
+            ), patch.object(hass.config_entries, "async_forward_entry_setups"):
 
                 # Call setup
                 result = await async_setup_entry(hass, entry)
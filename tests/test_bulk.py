@@ -0,0 +1,146 @@
+"""Test the bulk websocket commands."""
+
+from unittest.mock import patch
+
+from custom_components.family_bell.const import DOMAIN
+
+
+async def test_update_bells_applies_batch_once(
+    hass, ws_client, mock_storage, bell_data
+):
+    """A batch is applied with one save and one reschedule."""
+    scheduler = hass.data[DOMAIN]["scheduler"]
+    updated = bell_data("existing", "09:00")
+
+    with patch.object(
+        scheduler,
+        "async_update_bells",
+        wraps=scheduler.async_update_bells,
+    ) as mock_update:
+        await ws_client.send_json(
+            {
+                "id": 1,
+                "type": "family_bell/update_bells",
+                "bells": [bell_data("a"), bell_data("b"), updated],
+            }
+        )
+        response = await ws_client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["success"] is True
+    assert [r["id"] for r in response["result"]["results"]] == [
+        "a",
+        "b",
+        "existing",
+    ]
+    mock_update.assert_called_once()
+    assert mock_storage.async_delay_save.call_count == 1
+
+    bells = hass.data[DOMAIN]["storage"].bells
+    assert list(bells) == ["existing", "a", "b"]
+    assert bells["existing"].time == "09:00"
+    assert scheduler.scheduled_count == 3
+
+
+async def test_update_bells_is_atomic(
+    hass, ws_client, mock_storage, bell_data
+):
+    """One invalid bell rejects the whole batch."""
+    invalid = bell_data("bad")
+    invalid["enabled"] = "yes"
+
+    await ws_client.send_json(
+        {
+            "id": 1,
+            "type": "family_bell/update_bells",
+            "bells": [bell_data("a"), invalid],
+        }
+    )
+    response = await ws_client.receive_json()
+
+    assert response["success"]
+    result = response["result"]
+    assert result["success"] is False
+    assert result["results"][0]["id"] == "a"
+    assert result["results"][0]["success"] is False
+    assert result["results"][0]["error"]["code"] == "not_applied"
+    assert result["results"][1]["success"] is False
+    assert result["results"][1]["error"]["code"] == "invalid_format"
+
+    assert list(hass.data[DOMAIN]["storage"].bells) == ["existing"]
+    mock_storage.async_delay_save.assert_not_called()
+
+
+async def test_update_bells_reports_malformed_items(
+    hass, ws_client, bell_data
+):
+    """Bells that cannot be built are reported per item."""
+    no_name = bell_data("no_name")
+    del no_name["name"]
+
+    await ws_client.send_json(
+        {
+            "id": 1,
+            "type": "family_bell/update_bells",
+            "bells": [bell_data("a"), bell_data("bad_time", "8"), no_name],
+        }
+    )
+    response = await ws_client.receive_json()
+
+    assert response["success"]
+    results = response["result"]["results"]
+    assert results[0]["error"]["code"] == "not_applied"
+    assert [r["id"] for r in results[1:]] == ["bad_time", "no_name"]
+    for result in results[1:]:
+        assert result["success"] is False
+        assert result["error"]["code"] == "invalid_format"
+    assert list(hass.data[DOMAIN]["storage"].bells) == ["existing"]
+
+
+async def test_update_bell_validates_fields(hass, ws_client, bell_data):
+    """Missing fields, bad times and unknown days are rejected."""
+    bad_day = bell_data("bad_day")
+    bad_day["days"] = ["monday"]
+    for msg_id, bell in enumerate(
+        [{"id": "y", "time": "08:00"}, bell_data("bad_time", "8"), bad_day],
+        start=1,
+    ):
+        await ws_client.send_json(
+            {"id": msg_id, "type": "family_bell/update_bell", "bell": bell}
+        )
+        response = await ws_client.receive_json()
+        assert not response["success"]
+        assert response["error"]["code"] == "invalid_format"
+
+    assert list(hass.data[DOMAIN]["storage"].bells) == ["existing"]
+
+
+async def test_delete_bells(hass, ws_client, mock_storage, bell_data):
+    """Several bells are deleted with a single save."""
+    await ws_client.send_json(
+        {
+            "id": 1,
+            "type": "family_bell/update_bells",
+            "bells": [bell_data("a"), bell_data("b")],
+        }
+    )
+    await ws_client.receive_json()
+
+    await ws_client.send_json(
+        {
+            "id": 2,
+            "type": "family_bell/delete_bells",
+            "bell_ids": ["a", "existing", "missing"],
+        }
+    )
+    response = await ws_client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["results"] == [
+        {"id": "a", "success": True, "deleted": True},
+        {"id": "existing", "success": True, "deleted": True},
+        {"id": "missing", "success": True, "deleted": False},
+    ]
+    assert list(hass.data[DOMAIN]["storage"].bells) == ["b"]
+    assert hass.data[DOMAIN]["scheduler"].scheduled_count == 1
+    assert mock_storage.async_delay_save.call_count == 2
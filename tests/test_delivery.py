@@ -0,0 +1,220 @@
+"""Test the concurrent announcement delivery."""
+
+import asyncio
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.family_bell.delivery import (
+    DeliveryEngine,
+    DeliveryStep,
+)
+
+STEPS = [
+    DeliveryStep(
+        "media_player",
+        "play_media",
+        {"media_content_id": "chime.mp3", "media_content_type": "music"},
+        optional=True,
+    ),
+    DeliveryStep(
+        "tts",
+        "speak",
+        {"entity_id": "tts.piper", "message": "Hello"},
+        target="media_player_entity_id",
+    ),
+]
+
+
+async def test_slow_and_broken_speakers_are_isolated(hass: HomeAssistant):
+    """One speaker timing out or failing does not hold up the others."""
+    spoken = []
+
+    async def play_media(call):
+        if call.data["entity_id"] == ["media_player.slow"]:
+            await asyncio.sleep(10)
+
+    async def speak(call):
+        speaker = call.data["media_player_entity_id"]
+        if speaker == ["media_player.broken"]:
+            raise RuntimeError("offline")
+        spoken.append(speaker)
+
+    hass.services.async_register("media_player", "play_media", play_media)
+    hass.services.async_register("tts", "speak", speak)
+
+    engine = DeliveryEngine(hass, timeout=0.1)
+    results = await engine.async_deliver(
+        "bell",
+        ["media_player.kitchen", "media_player.slow", "media_player.broken"],
+        STEPS,
+    )
+
+    assert spoken == [["media_player.kitchen"]]
+    assert [(r["entity_id"], r["success"], r["error"]) for r in results] == [
+        ("media_player.kitchen", True, None),
+        ("media_player.slow", False, "timeout"),
+        ("media_player.broken", False, "offline"),
+    ]
+    assert engine.stats()["delivered"] == 1
+    assert engine.stats()["failed"] == 2
+    assert engine.stats()["timed_out"] == 1
+    assert engine.results["bell"] == results
+
+
+async def test_optional_step_failure_continues(hass: HomeAssistant):
+    """A failed chime is skipped and the announcement still plays."""
+    spoken = []
+
+    async def play_media(call):
+        raise RuntimeError("no chime")
+
+    async def speak(call):
+        spoken.append(call.data["media_player_entity_id"])
+
+    hass.services.async_register("media_player", "play_media", play_media)
+    hass.services.async_register("tts", "speak", speak)
+
+    engine = DeliveryEngine(hass)
+    results = await engine.async_deliver(
+        "bell", ["media_player.kitchen"], STEPS
+    )
+
+    assert results[0]["success"] is True
+    assert spoken == [["media_player.kitchen"]]
+
+    # Test deliveries are not kept for diagnostics
+    await engine.async_deliver(
+        "1760000000000", ["media_player.kitchen"], STEPS, record=False
+    )
+    assert list(engine.results) == ["bell"]
+
+
+def _speak(message):
+    return [
+        DeliveryStep(
+            "tts",
+            "speak",
+            {"entity_id": "tts.piper", "message": message},
+            target="media_player_entity_id",
+        )
+    ]
+
+
+def _non_blocking_speak(hass, played, playback=0.05):
+    """Register a tts.speak that returns once the player accepts it.
+
+    Like a real player, the speaker then reports playing until the
+    announcement is over.
+    """
+
+    async def speak(call):
+        (speaker,) = call.data["media_player_entity_id"]
+        state = hass.states.get(speaker)
+        played.append((speaker, call.data["message"], state.state))
+        hass.states.async_set(speaker, "playing")
+        if playback is not None:
+            hass.loop.call_later(
+                playback, hass.states.async_set, speaker, "idle"
+            )
+
+    hass.services.async_register("tts", "speak", speak)
+
+
+async def test_shared_speaker_is_serialized_and_merged(hass: HomeAssistant):
+    """Bells due together take turns per speaker; duplicates play once."""
+    hass.states.async_set("media_player.kitchen", "idle")
+    hass.states.async_set("media_player.den", "idle")
+    played = []
+    _non_blocking_speak(hass, played)
+
+    engine = DeliveryEngine(hass)
+    results = await engine.async_deliver_many(
+        [
+            ("a", ["media_player.kitchen", "media_player.den"], _speak("A")),
+            ("b", ["media_player.kitchen"], _speak("B")),
+            ("c", ["media_player.kitchen"], _speak("A")),
+        ]
+    )
+
+    # B only starts once the kitchen has finished playing A
+    kitchen = [(m, st) for s, m, st in played if s == "media_player.kitchen"]
+    assert kitchen == [("A", "idle"), ("B", "idle")]
+    assert ("media_player.den", "A", "idle") in played
+    assert [r["entity_id"] for r in results["a"]] == [
+        "media_player.kitchen",
+        "media_player.den",
+    ]
+    assert results["c"] == [results["a"][0]]
+    assert engine.stats()["merged"] == 1
+
+    # A later delivery also waits for the last announcement to finish
+    await engine.async_deliver("d", ["media_player.kitchen"], _speak("D"))
+    assert played[-1] == ("media_player.kitchen", "D", "idle")
+    # Let D finish playing
+    await asyncio.sleep(0.1)
+
+
+async def test_stuck_speaker_plays_next_after_timeout(hass: HomeAssistant):
+    """A speaker that never stops playing only delays the next bell."""
+    hass.states.async_set("media_player.kitchen", "idle")
+    played = []
+    _non_blocking_speak(hass, played, playback=None)
+
+    engine = DeliveryEngine(hass, playback_timeout=0.1)
+    start = time.monotonic()
+    await engine.async_deliver_many(
+        [
+            ("a", ["media_player.kitchen"], _speak("A")),
+            ("b", ["media_player.kitchen"], _speak("B")),
+        ]
+    )
+
+    assert [m for _, m, _ in played] == ["A", "B"]
+    assert time.monotonic() - start >= 0.1
+
+
+async def test_announcement_over_music_does_not_wait(hass: HomeAssistant):
+    """A speaker that goes back to its music is free for the next bell."""
+    music = {"media_content_id": "spotify:track:1"}
+    hass.states.async_set("media_player.kitchen", "playing", music)
+    played = []
+
+    async def speak(call):
+        # The announcement plays over the music, which then resumes
+        played.append(call.data["message"])
+        hass.states.async_set(
+            "media_player.kitchen",
+            "playing",
+            {"media_content_id": "media-source://tts/bell"},
+        )
+        hass.loop.call_later(
+            0.05,
+            hass.states.async_set,
+            "media_player.kitchen",
+            "playing",
+            music,
+        )
+
+    hass.services.async_register("tts", "speak", speak)
+
+    engine = DeliveryEngine(hass)
+    start = time.monotonic()
+    await engine.async_deliver_many(
+        [
+            ("a", ["media_player.kitchen"], _speak("A")),
+            ("b", ["media_player.kitchen"], _speak("B")),
+        ]
+    )
+    assert played == ["A", "B"]
+
+    # A player that never reports the announcement is not waited for
+    hass.services.async_register(
+        "tts", "speak", lambda call: played.append(call.data["message"])
+    )
+    await asyncio.sleep(0.1)
+    await engine.async_deliver("c", ["media_player.kitchen"], _speak("C"))
+    await engine.async_deliver("d", ["media_player.kitchen"], _speak("D"))
+
+    assert played[2:] == ["C", "D"]
+    assert time.monotonic() - start < 1
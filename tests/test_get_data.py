@@ -0,0 +1,42 @@
+"""Test the revisioned get_data command."""
+
+from custom_components.family_bell.const import DOMAIN
+
+
+async def test_get_data_revisions(hass, ws_client, mock_storage):
+    """Up-to-date clients get "unchanged"; the live data is not touched."""
+    await ws_client.send_json({"id": 1, "type": "family_bell/get_data"})
+    data = (await ws_client.receive_json())["result"]
+    revision = data["revision"]
+    assert [b["id"] for b in data["bells"]] == ["existing"]
+    assert data["global_tts"]["provider"] == "tts.global"
+    assert "global_tts" not in hass.data[DOMAIN]["storage"].data
+
+    await ws_client.send_json(
+        {"id": 2, "type": "family_bell/get_data", "revision": revision}
+    )
+    assert (await ws_client.receive_json())["result"] == {
+        "unchanged": True,
+        "revision": revision,
+    }
+
+    await ws_client.send_json(
+        {
+            "id": 3,
+            "type": "family_bell/delete_bell",
+            "bell_id": "existing",
+        }
+    )
+    await ws_client.receive_json()
+
+    await ws_client.send_json(
+        {"id": 4, "type": "family_bell/get_data", "revision": revision}
+    )
+    data = (await ws_client.receive_json())["result"]
+    assert data["revision"] > revision
+    assert data["bells"] == []
+
+    # The payload persisted by the Store has no injected keys
+    saved = mock_storage.async_delay_save.call_args[0][0]()
+    assert "global_tts" not in saved
+    assert "version" not in saved
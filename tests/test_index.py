@@ -0,0 +1,70 @@
+"""Test the bell listing index."""
+
+from custom_components.family_bell.index import BellIndex
+
+
+def _pages(index, limit, **filters):
+    """Return every page of a query, following the cursors."""
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = index.query(cursor=cursor, limit=limit, **filters)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+def test_pages_are_sorted_by_time(make_bell):
+    """Bells are listed by time of day, one cursor page at a time."""
+    index = BellIndex(
+        [
+            make_bell("c", "10:00"),
+            make_bell("a", "07:00"),
+            make_bell("b", "8:05"),
+        ]
+    )
+    index.add(make_bell("d", "07:00"))
+
+    # Single-digit hours sort by time, not as text
+    assert _pages(index, 2) == [["a", "d"], ["b", "c"]]
+    assert _pages(index, 10) == [["a", "d", "b", "c"]]
+
+
+def test_filters_combine(make_bell):
+    """Day, speaker, state and text filters narrow the same listing."""
+    index = BellIndex(
+        [
+            make_bell("1", "07:00", days=["mon", "tue"], message="Wake up"),
+            make_bell("2", "08:00", days=["mon"], speakers=["media_player.b"]),
+            make_bell("3", "09:00", days=["tue"], enabled=False),
+            make_bell("4", "10:00", days=["tue"], message="Lunch soon"),
+        ]
+    )
+
+    assert _pages(index, 10, day="tue") == [["1", "3", "4"]]
+    assert _pages(index, 1, day="tue", enabled=True) == [["1"], ["4"]]
+    assert _pages(index, 10, enabled=False) == [["3"]]
+    assert _pages(index, 10, speaker="media_player.b") == [["2"]]
+    assert _pages(index, 10, text="LUNCH") == [["4"]]
+    assert _pages(index, 10, text="09:") == [["3"]]
+    assert _pages(index, 10, day="sun") == [[]]
+
+    index.add(make_bell("4", "06:00", days=["tue"], message="Breakfast"))
+    index.remove("1")
+    assert _pages(index, 10, day="tue") == [["4", "3"]]
+    assert _pages(index, 10, text="lunch") == [[]]
+
+
+async def test_list_bells_command(hass, ws_client):
+    """The websocket command pages through the stored bells."""
+    await ws_client.send_json(
+        {"id": 1, "type": "family_bell/list_bells", "limit": 1}
+    )
+    result = (await ws_client.receive_json())["result"]
+    assert [b["id"] for b in result["bells"]] == ["existing"]
+    assert result["next_cursor"] is None
+
+    await ws_client.send_json(
+        {"id": 2, "type": "family_bell/list_bells", "day": "sat"}
+    )
+    assert (await ws_client.receive_json())["result"]["bells"] == []
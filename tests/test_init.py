@@ -1,8 +1,15 @@
 """Test family_bell setup process."""
 
+import json
 from unittest.mock import patch, MagicMock, AsyncMock
 from homeassistant.core import HomeAssistant
+from homeassistant.loader import async_get_integration
 from custom_components.family_bell import async_setup_entry, DOMAIN, PANEL_URL
+from custom_components.family_bell import (
+    BUNDLE_URL,
+    _async_register_static_paths,
+    _probe_frontend,
+)
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
@@ -38,14 +45,18 @@ async def test_setup_entry_panel_conflict(hass: HomeAssistant):
         ):
 
             # Mock schedule_bells to simplify test and avoid side effects
-            with patch("custom_components.family_bell.schedule_bells"):
+            # The entry is not loaded, so HA refuses to forward it
+            with patch(
+                "custom_components.family_bell.schedule_bells"
+            ), patch.object(hass.config_entries, "async_forward_entry_setups"):
 
                 # Call setup
                 result = await async_setup_entry(hass, entry)
 
         # Assertions
         assert result is True
-        expected_url = f"{PANEL_URL}?v=unknown"
+        integration = await async_get_integration(hass, DOMAIN)
+        expected_url = f"{PANEL_URL}?v={integration.version}"
         mock_register.assert_called_once_with(
             hass,
             component_name="custom",
@@ -98,7 +109,10 @@ async def test_setup_entry_panel_overwrite_error(hass: HomeAssistant):
         ):
 
             # Mock schedule_bells
-            with patch("custom_components.family_bell.schedule_bells"):
+            # The entry is not loaded, so HA refuses to forward it
+            with patch(
+                "custom_components.family_bell.schedule_bells"
+            ), patch.object(hass.config_entries, "async_forward_entry_setups"):
                 # Mock async_remove_panel to do nothing (simulate failure to remove)
                 with patch(
                     "custom_components.family_bell.async_remove_panel",
@@ -111,3 +125,29 @@ async def test_setup_entry_panel_overwrite_error(hass: HomeAssistant):
     # If the fix works, result should be True (setup succeeds despite error)
     assert result is True
     assert mock_register.called
+
+
+async def test_frontend_bundle_is_served_cached(hass: HomeAssistant, tmp_path):
+    """A built bundle is found and served with long-lived cache headers."""
+    (tmp_path / "family_bell_panel.js").write_text("")
+    assert _probe_frontend(str(tmp_path)) == (True, None)
+
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "manifest.json").write_text(
+        json.dumps({"family_bell_panel.js": "family_bell_panel-ABC123.js"})
+    )
+    assert _probe_frontend(str(tmp_path)) == (
+        True,
+        "family_bell_panel-ABC123.js",
+    )
+
+    hass.http = MagicMock()
+    hass.http.async_register_static_paths = AsyncMock()
+    await _async_register_static_paths(
+        hass, str(tmp_path), "family_bell_panel-ABC123.js"
+    )
+    bundle, modules = hass.http.async_register_static_paths.call_args[0][0]
+    assert (bundle.url_path, bundle.path) == (BUNDLE_URL, str(dist))
+    assert bundle.cache_headers
+    assert not modules.cache_headers
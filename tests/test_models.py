@@ -0,0 +1,112 @@
+"""Test the Family Bell data model."""
+
+import datetime
+
+from custom_components.family_bell.models import Bell, Vacation
+
+
+def test_bell_parses_once_and_round_trips():
+    """Derived fields are parsed on load and the JSON shape is kept."""
+    stored = {
+        "id": "1",
+        "name": "Morning",
+        "time": "07:45",
+        "days": ["mon", "wed", "fri"],
+        "message": "Good morning",
+        "enabled": True,
+        "speakers": ["media_player.kitchen", "media_player.kitchen"],
+        "tts_provider": "",
+        "tts_voice": None,
+        "tts_language": "en",
+        "sound": {
+            "entity_id": "media_player.kitchen",
+            "media_content_id": "media-source://chime.mp3",
+            "media_content_type": "audio/mpeg",
+        },
+        "lead_time": 20,
+    }
+    bell = Bell.from_dict(stored)
+
+    assert bell.timing == (7, 45, 0b10101)
+    assert bell.speakers == ("media_player.kitchen",)
+    assert bell.tts_provider is None
+    assert bell.media_content_id == "media-source://chime.mp3"
+    assert bell.media_content_type == "audio/mpeg"
+
+    assert bell.to_dict() == {
+        **stored,
+        "speakers": ["media_player.kitchen"],
+        "tts_provider": None,
+    }
+    assert Bell.from_dict(bell.to_dict()) == bell
+
+
+def test_bell_string_sound():
+    """A plain string sound is played as music."""
+    bell = Bell.from_dict(
+        {
+            "id": "1",
+            "name": "Chime",
+            "time": "12:00",
+            "days": [],
+            "message": "Lunch",
+            "enabled": False,
+            "speakers": [],
+            "sound": "http://example.com/chime.mp3",
+        }
+    )
+    assert bell.media_content_id == "http://example.com/chime.mp3"
+    assert bell.media_content_type == "music"
+    assert bell.day_mask == 0
+
+
+def test_vacation_skips_malformed_ranges():
+    """Malformed ranges are ignored instead of failing every check."""
+    vacation = Vacation.from_dict(
+        {
+            "enabled": True,
+            "ranges": [
+                {"start": "2024-12-20", "end": "2025-01-03"},
+                {"start": "not a date", "end": "2025-01-03"},
+                {"start": "2025-02-01"},
+            ],
+        }
+    )
+    assert len(vacation.ranges) == 1
+    assert vacation.contains(datetime.date(2024, 12, 25))
+    assert not vacation.contains(datetime.date(2025, 1, 4))
+    disabled = Vacation.from_dict(
+        {
+            "enabled": False,
+            "ranges": [{"start": "2024-12-20", "end": "2025-01-03"}],
+        }
+    )
+    assert not disabled.contains(datetime.date(2024, 12, 25))
+
+
+def test_vacation_index_merges_ranges():
+    """Overlapping and adjacent ranges collapse into one break."""
+    vacation = Vacation.from_dict(
+        {
+            "enabled": True,
+            "ranges": [
+                {"start": "2025-01-02", "end": "2025-01-05"},
+                {"start": "2024-12-20", "end": "2024-12-31"},
+                {"start": "2025-01-01", "end": "2025-01-01"},
+                {"start": "2025-01-03", "end": "2025-01-04"},
+                {"start": "2025-04-14", "end": "2025-04-18"},
+            ],
+        }
+    )
+    day = datetime.date
+
+    assert vacation.contains(day(2024, 12, 20))
+    assert vacation.contains(day(2025, 1, 5))
+    assert not vacation.contains(day(2024, 12, 19))
+    assert not vacation.contains(day(2025, 1, 6))
+    assert vacation.contains(day(2025, 4, 16))
+
+    # The whole winter break is skipped in one step
+    assert vacation.next_non_vacation_day(day(2024, 12, 22)) == day(2025, 1, 6)
+    assert vacation.next_non_vacation_day(day(2025, 2, 1)) == day(2025, 2, 1)
+    assert vacation.next_non_vacation_day(day(2025, 4, 18)) == day(2025, 4, 19)
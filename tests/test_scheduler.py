@@ -0,0 +1,359 @@
+"""Test the Family Bell timer engine."""
+
+import datetime
+from unittest.mock import patch, MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.family_bell.models import (
+    Vacation,
+    VacationRange,
+    day_mask,
+)
+from custom_components.family_bell.scheduler import (
+    BellScheduler,
+    next_fire_time,
+)
+
+
+async def _prepare(bells):
+    pass
+
+
+def test_next_fire_time_rolls_over(make_bell):
+    """A bell whose time has passed today fires tomorrow."""
+    now = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=dt_util.UTC)
+    assert next_fire_time(make_bell("a", "13:30").timing, now) == now.replace(
+        hour=13, minute=30
+    )
+    assert next_fire_time(make_bell("a", "12:00").timing, now) == now.replace(
+        day=2, hour=12
+    )
+
+
+def test_next_fire_time_skips_to_matching_weekday():
+    """Weekday bells jump straight over the weekend."""
+    # 2024-01-05 is a Friday
+    friday = datetime.datetime(2024, 1, 5, 9, 0, tzinfo=dt_util.UTC)
+    weekdays = day_mask(["mon", "tue", "wed", "thu", "fri"])
+    assert weekdays == 0b0011111
+
+    assert next_fire_time((8, 0, weekdays), friday) == datetime.datetime(
+        2024, 1, 8, 8, 0, tzinfo=dt_util.UTC
+    )
+    assert next_fire_time((10, 0, weekdays), friday) == friday.replace(hour=10)
+    assert next_fire_time(
+        (8, 0, day_mask(["fri"])), friday
+    ) == datetime.datetime(2024, 1, 12, 8, 0, tzinfo=dt_util.UTC)
+    assert next_fire_time((8, 0, 0), friday) is None
+
+
+def test_next_fire_time_skips_vacation():
+    """A break is skipped in one step, landing on the first bell after."""
+    # 2024-12-20 is a Friday; the break ends on Sunday 2025-01-05
+    friday = datetime.datetime(2024, 12, 20, 9, 0, tzinfo=dt_util.UTC)
+    vacation = Vacation.from_dict(
+        {
+            "enabled": True,
+            "ranges": [
+                {"start": "2024-12-21", "end": "2024-12-31"},
+                {"start": "2025-01-01", "end": "2025-01-05"},
+            ],
+        }
+    )
+    weekdays = day_mask(["mon", "tue", "wed", "thu", "fri"])
+
+    assert next_fire_time((10, 0, weekdays), friday, vacation) == (
+        friday.replace(hour=10)
+    )
+    assert next_fire_time(
+        (8, 0, weekdays), friday, vacation
+    ) == datetime.datetime(2025, 1, 6, 8, 0, tzinfo=dt_util.UTC)
+    # Midnight bells on the first day back still ring
+    assert next_fire_time(
+        (0, 0, weekdays), friday, vacation
+    ) == datetime.datetime(2025, 1, 6, 0, 0, tzinfo=dt_util.UTC)
+
+
+async def test_single_timer_for_many_bells(hass: HomeAssistant, make_bell):
+    """Only one timer is armed no matter how many bells are queued."""
+    fired = []
+
+    async def fire(bells):
+        fired.extend(bell.id for bell in bells)
+
+    scheduler = BellScheduler(hass, fire, _prepare)
+    bells = [
+        make_bell(f"b{i}", f"{i % 24:02d}:{i % 60:02d}") for i in range(300)
+    ]
+
+    with patch(
+        "custom_components.family_bell.scheduler."
+        "async_track_point_in_utc_time",
+        return_value=MagicMock(),
+    ) as mock_track:
+        scheduler.async_load(bells, Vacation())
+
+    assert scheduler.scheduled_count == 300
+    assert mock_track.call_count == 1
+    scheduler.async_stop()
+
+
+async def test_upcoming_merges_bells_in_order(hass: HomeAssistant, make_bell):
+    """Upcoming fires interleave all bells and skip vacation days."""
+    now = dt_util.now()
+    tomorrow = now.date() + datetime.timedelta(days=1)
+    vacation = Vacation(
+        enabled=True, ranges=(VacationRange(tomorrow, tomorrow),)
+    )
+    bells = [
+        make_bell("a", "07:00"),
+        make_bell("b", "19:30", days=["mon", "wed"]),
+    ]
+    scheduler = BellScheduler(hass, None, _prepare)
+
+    with patch(
+        "custom_components.family_bell.scheduler."
+        "async_track_point_in_utc_time",
+        return_value=MagicMock(),
+    ):
+        scheduler.async_load(bells, vacation)
+
+    expected = []
+    for bell in bells:
+        fire_time = now
+        for _ in range(8):
+            fire_time = next_fire_time(bell.timing, fire_time, vacation)
+            expected.append((fire_time, bell.id))
+    expected.sort()
+
+    fires = scheduler.upcoming(8)
+    assert [(t, bell.id) for t, bell in fires] == expected[:8]
+    assert all(t.date() != tomorrow for t, _ in fires)
+    assert scheduler.scheduled_count == 2
+    scheduler.async_stop()
+
+
+async def test_timer_pops_due_bells_and_rearms(hass: HomeAssistant, make_bell):
+    """Due bells are rung together and the timer moves to the next one."""
+    fired = []
+
+    async def fire(bells):
+        fired.extend(bell.id for bell in bells)
+
+    prepared = []
+
+    async def prepare(bells):
+        prepared.append(bells)
+
+    scheduler = BellScheduler(hass, fire, prepare)
+    now = dt_util.now()
+    first = (now + datetime.timedelta(hours=1)).strftime("%H:%M")
+    later = (now + datetime.timedelta(hours=2)).strftime("%H:%M")
+
+    with patch(
+        "custom_components.family_bell.scheduler."
+        "async_track_point_in_utc_time",
+        return_value=MagicMock(),
+    ) as mock_track:
+        scheduler.async_load(
+            [
+                make_bell("a", first),
+                make_bell("b", first),
+                make_bell("c", later),
+            ],
+            Vacation(),
+        )
+        due_at = mock_track.call_args[0][2]
+        await hass.async_block_till_done()
+        assert sorted(b.id for b in prepared[-1]) == ["a", "b"]
+
+        scheduler._async_timer_fired(dt_util.as_utc(due_at))
+        await hass.async_block_till_done()
+
+        assert sorted(fired) == ["a", "b"]
+        assert [b.id for b in prepared[-1]] == ["c"]
+        assert scheduler.scheduled_count == 3
+        assert mock_track.call_count == 2
+        assert mock_track.call_args[0][2] > due_at
+
+    scheduler.async_stop()
+
+
+async def test_warm_up_runs_lead_time_before_fire(
+    hass: HomeAssistant, make_bell
+):
+    """The timer wakes up early for a bell's warm-up, then fires it."""
+    fired = []
+    warmed = []
+
+    async def fire(bells):
+        fired.extend(bell.id for bell in bells)
+
+    async def warm_up(bells):
+        warmed.append([b.id for b in bells])
+
+    scheduler = BellScheduler(
+        hass,
+        fire,
+        _prepare,
+        warm_up_callback=warm_up,
+        lead_time=lambda bell: bell.lead_time or 0,
+    )
+    now = dt_util.now()
+    at = (now + datetime.timedelta(hours=1)).strftime("%H:%M")
+
+    with patch(
+        "custom_components.family_bell.scheduler."
+        "async_track_point_in_utc_time",
+        return_value=MagicMock(),
+    ) as mock_track:
+        scheduler.async_load(
+            [make_bell("a", at, lead_time=30), make_bell("b", at)], Vacation()
+        )
+        warm_at = mock_track.call_args[0][2]
+
+        scheduler._async_timer_fired(dt_util.as_utc(warm_at))
+        await hass.async_block_till_done()
+
+        assert warmed == [["a"]]
+        assert fired == []
+        fire_at = mock_track.call_args[0][2]
+        assert fire_at - warm_at == datetime.timedelta(seconds=30)
+
+        scheduler._async_timer_fired(dt_util.as_utc(fire_at))
+        await hass.async_block_till_done()
+
+        assert sorted(fired) == ["a", "b"]
+        assert warmed == [["a"]]
+        # The next day's warm-up is armed ahead of the next fire
+        next_fire = scheduler._entries["a"][0]
+        assert next_fire > fire_at
+        assert mock_track.call_args[0][2] == next_fire - datetime.timedelta(
+            seconds=30
+        )
+
+    scheduler.async_stop()
+
+
+async def test_update_callback_on_head_change(hass: HomeAssistant, make_bell):
+    """Listeners are told when the next fire or the count changes."""
+
+    async def fire(bells):
+        pass
+
+    updates = []
+    scheduler = BellScheduler(
+        hass, fire, _prepare, update_callback=lambda: updates.append(1)
+    )
+    now = dt_util.now()
+    first = (now + datetime.timedelta(hours=1)).strftime("%H:%M")
+    later = (now + datetime.timedelta(hours=2)).strftime("%H:%M")
+
+    with patch(
+        "custom_components.family_bell.scheduler."
+        "async_track_point_in_utc_time",
+        return_value=MagicMock(),
+    ) as mock_track:
+        scheduler.async_load(
+            [make_bell("a", first), make_bell("b", later)], Vacation()
+        )
+        assert len(updates) == 1
+        fire_time, bells = scheduler.next_fire()
+        assert [b.id for b in bells] == ["a"]
+
+        scheduler.async_remove_bells([])
+        assert len(updates) == 1
+
+        scheduler._async_timer_fired(dt_util.as_utc(fire_time))
+        assert len(updates) == 2
+        assert [b.id for b in scheduler.next_fire()[1]] == ["b"]
+
+        scheduler.async_remove_bell("b")
+        assert len(updates) == 3
+        assert mock_track.called
+        await hass.async_block_till_done()
+
+    scheduler.async_stop()
+
+
+async def test_incremental_update_and_remove(hass: HomeAssistant, make_bell):
+    """Editing one bell only touches that bell's entry."""
+
+    async def fire(bells):
+        pass
+
+    scheduler = BellScheduler(hass, fire, _prepare)
+    with patch(
+        "custom_components.family_bell.scheduler."
+        "async_track_point_in_utc_time",
+        return_value=MagicMock(),
+    ) as mock_track:
+        scheduler.async_load(
+            [make_bell(f"b{i}", "23:59") for i in range(10)], Vacation()
+        )
+        assert mock_track.call_count == 1
+
+        # A later bell does not move the head, so the timer is kept
+        scheduler.async_update_bell(make_bell("b0", "23:59"))
+        assert scheduler.scheduled_count == 10
+        assert mock_track.call_count == 1
+
+        scheduler.async_update_bell(make_bell("b1", "23:59", enabled=False))
+        scheduler.async_remove_bell("b2")
+        scheduler.async_remove_bell("missing")
+        assert scheduler.scheduled_count == 8
+
+        scheduler.async_update_bell(make_bell("new", "23:59"))
+        assert scheduler.scheduled_count == 9
+
+        scheduler.async_update_bell(make_bell("new", "23:59", days=[]))
+        assert scheduler.scheduled_count == 8
+
+    scheduler.async_stop()
+
+
+async def test_vacation_change_requeues_affected_bells(
+    hass: HomeAssistant, make_bell
+):
+    """Bells come back after a vacation without a full rebuild."""
+
+    async def fire(bells):
+        pass
+
+    scheduler = BellScheduler(hass, fire, _prepare)
+    tomorrow = dt_util.now().date() + datetime.timedelta(days=1)
+    vacation = Vacation.from_dict(
+        {
+            "enabled": True,
+            "ranges": [
+                {
+                    "start": tomorrow.isoformat(),
+                    "end": (tomorrow + datetime.timedelta(days=2)).isoformat(),
+                }
+            ],
+        }
+    )
+
+    with patch(
+        "custom_components.family_bell.scheduler."
+        "async_track_point_in_utc_time",
+        return_value=MagicMock(),
+    ) as mock_track:
+        scheduler.async_load([make_bell("a", "00:00")], Vacation())
+        assert mock_track.call_args[0][2].date() == tomorrow
+
+        scheduler.async_set_vacation(vacation)
+        assert mock_track.call_args[0][2].date() == tomorrow + (
+            datetime.timedelta(days=3)
+        )
+
+        with patch.object(
+            scheduler, "async_update_bells", wraps=scheduler.async_update_bells
+        ) as mock_update:
+            scheduler.async_set_vacation(Vacation())
+        assert [b.id for b in mock_update.call_args[0][0]] == ["a"]
+        assert mock_track.call_args[0][2].date() == tomorrow
+
+    scheduler.async_stop()
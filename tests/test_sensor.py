@@ -0,0 +1,26 @@
+"""Test the Family Bell sensors."""
+
+
+async def test_sensors_follow_schedule(hass, ws_client):
+    """Sensors are pushed when bells are added or removed."""
+    count = hass.states.get("sensor.family_bell_scheduled_bells")
+    assert count.state == "1"
+    next_bell = hass.states.get("sensor.family_bell_next_bell")
+    assert next_bell.state not in ("unknown", "unavailable")
+    assert next_bell.attributes["bell_ids"] == ["existing"]
+    assert next_bell.attributes["bell_name"] == "Bell existing"
+
+    await ws_client.send_json(
+        {
+            "id": 1,
+            "type": "family_bell/delete_bell",
+            "bell_id": "existing",
+        }
+    )
+    await ws_client.receive_json()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.family_bell_scheduled_bells").state == "0"
+    next_bell = hass.states.get("sensor.family_bell_next_bell")
+    assert next_bell.state == "unknown"
+    assert next_bell.attributes["bell_ids"] == []
@@ -0,0 +1,122 @@
+"""Test Family Bell write coalescing."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.family_bell.storage import BellStorage, SAVE_DELAY
+
+
+async def test_bursts_are_coalesced():
+    """Several edits in a row produce a single delayed write."""
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    data = {"bells": [], "vacation": {"enabled": False, "ranges": []}}
+    storage = BellStorage(store, data)
+
+    for _ in range(5):
+        storage.async_schedule_save()
+
+    assert store.async_delay_save.call_count == 5
+    data_func, delay = store.async_delay_save.call_args[0]
+    assert delay == SAVE_DELAY
+    assert storage.stats() == {
+        "saves_requested": 5,
+        "saves_coalesced": 4,
+        "writes": 0,
+        "pending": True,
+    }
+
+    # The Store calls the data function once the delay expires
+    assert data_func() == {
+        "vacation": {"enabled": False, "ranges": []},
+        "bells": [],
+    }
+    assert storage.stats()["writes"] == 1
+    assert storage.dirty is False
+
+    # Nothing pending, nothing to flush
+    await storage.async_flush()
+    store.async_save.assert_not_called()
+
+
+async def test_flush_writes_pending_edits():
+    """Unloading writes pending edits immediately."""
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    data = {"bells": [], "vacation": {"enabled": False, "ranges": []}}
+    storage = BellStorage(store, data)
+
+    storage.async_schedule_save()
+    await storage.async_flush()
+
+    store.async_save.assert_awaited_once_with(
+        {"vacation": {"enabled": False, "ranges": []}, "bells": []}
+    )
+    assert storage.dirty is False
+
+
+def test_bell_index_keeps_payload_shape(bell_data, make_bell):
+    """Bells are indexed by id but persisted as the original list."""
+    data = {
+        "bells": [bell_data("a", "08:00"), bell_data("b", "09:00")],
+        "vacation": {"enabled": False, "ranges": []},
+    }
+    storage = BellStorage(MagicMock(), data)
+
+    assert storage.get_bell("b") == make_bell("b", "09:00")
+    assert storage.get_bell("missing") is None
+
+    storage.upsert_bell(make_bell("a", "07:00"))
+    storage.upsert_bell(make_bell("c", "10:00"))
+    assert storage.remove_bell("b") is True
+    assert storage.remove_bell("b") is False
+
+    assert storage.as_dict() == {
+        "bells": [
+            make_bell("a", "07:00").to_dict(),
+            make_bell("c", "10:00").to_dict(),
+        ],
+        "vacation": {"enabled": False, "ranges": []},
+    }
+
+
+def test_malformed_stored_bells_are_skipped(bell_data):
+    """A bell that cannot be parsed is dropped instead of failing setup."""
+    no_name = bell_data("no_name", "08:00")
+    del no_name["name"]
+    data = {
+        "bells": [
+            bell_data("a", "08:00"),
+            no_name,
+            bell_data("bad_time", "25:00"),
+            "not a bell",
+        ],
+        "vacation": {"enabled": False, "ranges": []},
+    }
+    storage = BellStorage(MagicMock(), data)
+
+    assert list(storage.bells) == ["a"]
+    assert len(storage.index) == 1
+
+
+def test_changes_are_popped_as_a_delta(bell_data, make_bell):
+    """Edits since the last save are returned once, under a new revision."""
+    storage = BellStorage(
+        MagicMock(), {"bells": [bell_data("a", "08:00")], "vacation": {}}
+    )
+    revision = storage.revision
+    assert storage.pop_changes() is None
+
+    storage.upsert_bell(make_bell("b", "09:00"))
+    storage.remove_bell("a")
+    storage.upsert_bell(make_bell("c", "10:00"))
+    storage.remove_bell("c")
+    storage.set_vacation({"enabled": True, "ranges": []})
+
+    assert storage.pop_changes() == {
+        "revision": revision + 1,
+        "bells": [make_bell("b", "09:00").to_dict()],
+        "deleted": ["a", "c"],
+        "vacation": {"enabled": True, "ranges": []},
+    }
+    assert storage.pop_changes() is None
+    assert storage.revision == revision + 1
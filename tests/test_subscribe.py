@@ -0,0 +1,55 @@
+"""Test the live data subscription."""
+
+
+async def _receive(ws_client, count):
+    """Return the next ``count`` messages by id, in any order."""
+    messages = {}
+    for _ in range(count):
+        msg = await ws_client.receive_json()
+        messages.setdefault(msg["id"], []).append(msg)
+    return messages
+
+
+async def test_subscribe_streams_deltas(hass, ws_client, bell_data):
+    """Subscribers get a snapshot, then only the changed data."""
+    await ws_client.send_json({"id": 1, "type": "family_bell/subscribe"})
+    result, snapshot = (await _receive(ws_client, 2))[1]
+    assert result["success"]
+    revision = snapshot["event"]["revision"]
+    data = snapshot["event"]["snapshot"]
+    assert [b["id"] for b in data["bells"]] == ["existing"]
+    assert data["global_tts"]["provider"] == "tts.global"
+
+    await ws_client.send_json(
+        {"id": 2, "type": "family_bell/update_bell", "bell": bell_data("a")}
+    )
+    messages = await _receive(ws_client, 2)
+    assert messages[2][0]["success"]
+    delta = messages[1][0]["event"]
+    assert delta["revision"] == revision + 1
+    # The acknowledgement names the revision the change landed in
+    assert messages[2][0]["result"]["revision"] == revision + 1
+    assert [b["id"] for b in delta["bells"]] == ["a"]
+    assert delta["deleted"] == []
+    assert "last_defaults" in delta
+    assert "vacation" not in delta
+
+    await ws_client.send_json(
+        {"id": 3, "type": "family_bell/delete_bell", "bell_id": "existing"}
+    )
+    delta = (await _receive(ws_client, 2))[1][0]["event"]
+    assert delta == {
+        "revision": revision + 2,
+        "bells": [],
+        "deleted": ["existing"],
+    }
+
+    vacation = {"enabled": True, "ranges": []}
+    await ws_client.send_json(
+        {"id": 4, "type": "family_bell/vacation", "vacation": vacation}
+    )
+    messages = await _receive(ws_client, 2)
+    delta = messages[1][0]["event"]
+    assert delta["revision"] == revision + 3
+    assert messages[4][0]["result"]["revision"] == revision + 3
+    assert delta["vacation"] == vacation
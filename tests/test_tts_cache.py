@@ -0,0 +1,81 @@
+"""Test the pre-rendered TTS cache."""
+
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.family_bell.tts_cache import TTSCache, tts_cache_key
+
+
+def _media_id(hass, message, **kwargs):
+    return f"media-source://tts/{kwargs['engine']}?message={message}"
+
+
+async def test_prepare_renders_once_and_is_lru_bounded(hass: HomeAssistant):
+    """Announcements are rendered once and the oldest are evicted."""
+    cache = TTSCache(hass, max_size=2)
+    render = AsyncMock(return_value=("mp3", b""))
+
+    with patch(
+        "custom_components.family_bell.tts_cache.generate_media_source_id",
+        side_effect=_media_id,
+    ) as mock_generate, patch(
+        "custom_components.family_bell.tts_cache."
+        "async_get_media_source_audio",
+        render,
+    ):
+        key = tts_cache_key("Hello", "tts.piper", None, None)
+        media_id = await cache.async_prepare("a", key)
+        assert media_id == "media-source://tts/tts.piper?message=Hello"
+        # A second bell with the same announcement shares the rendering
+        assert await cache.async_prepare("b", key) == media_id
+        assert render.await_count == 1
+        assert mock_generate.call_args[1]["cache"] is True
+
+        await cache.async_prepare(
+            "c", tts_cache_key("Two", "tts.piper", None, None)
+        )
+        await cache.async_prepare(
+            "d", tts_cache_key("Three", "tts.piper", "v", "de")
+        )
+
+    assert len(cache) == 2
+    assert cache.get(key) is None
+    assert cache.get(tts_cache_key("Three", "tts.piper", "v", "de"))
+    assert cache.stats() == {"size": 2, "hits": 1, "misses": 1}
+
+
+async def test_invalidate_on_edit(hass: HomeAssistant):
+    """Editing a bell drops its rendering unless another bell shares it."""
+    cache = TTSCache(hass)
+    key = tts_cache_key("Hello", "tts.piper", None, None)
+
+    with patch(
+        "custom_components.family_bell.tts_cache.generate_media_source_id",
+        side_effect=_media_id,
+    ), patch(
+        "custom_components.family_bell.tts_cache."
+        "async_get_media_source_audio",
+        AsyncMock(return_value=("mp3", b"")),
+    ):
+        await cache.async_prepare("a", key)
+        await cache.async_prepare("b", key)
+
+    cache.invalidate_bell("a")
+    assert cache.get(key) is not None
+    cache.invalidate_bell("b")
+    assert cache.get(key) is None
+
+
+async def test_render_failure_falls_back(hass: HomeAssistant):
+    """A failed rendering is not cached."""
+    cache = TTSCache(hass)
+    key = tts_cache_key("Hello", "tts.missing", None, None)
+
+    with patch(
+        "custom_components.family_bell.tts_cache.generate_media_source_id",
+        side_effect=ValueError("unknown engine"),
+    ):
+        assert await cache.async_prepare("a", key) is None
+
+    assert len(cache) == 0